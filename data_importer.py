@@ -618,8 +618,8 @@ class DataImporter:
 
                 # Show progress dialog for large assay datasets
                 if record_count > CHUNKED_IMPORT_THRESHOLD:
+                    # Shows itself once the import outlasts its minimum duration
                     progress_dialog = ImportProgressDialog(record_count, self.dlg)
-                    progress_dialog.show()
                     progress_dialog.update_progress(0, "Creating trace visualization...")
 
                     # Define progress callback for trace layer creation
@@ -668,9 +668,8 @@ class DataImporter:
     
     def _perform_chunked_import(self, data, layer_name, color, record_count, warning_dialog_shown=False, point_size=3.0):
         """Perform chunked import with progress dialog."""
-        # Create progress dialog
+        # Create progress dialog; it shows itself once the import outlasts its minimum duration
         progress_dialog = ImportProgressDialog(record_count, self.dlg)
-        progress_dialog.show()
 
         # Define progress callback
         def progress_callback(processed_count, chunk_info):
@@ -107,6 +107,20 @@ OSM_LAYER_URL = "type=xyz&url=https://tile.openstreetmap.org/{z}/{x}/{y}.png&zma
 # Used in: src/utils/qgis_helpers.py to skip auto-zoom for large datasets (prevents UI freezing)
 AUTO_ZOOM_THRESHOLD = 50000  # Don't auto-zoom for datasets larger than this
 
+# Used in: src/ui/components.py (ImportProgressDialog) to cap progress repaints at ~30 Hz
+PROGRESS_UPDATE_INTERVAL_MS = 33  # Minimum time between progress dialog updates
+IMPORT_PROGRESS_SHOW_DELAY_MS = 150  # Imports finishing sooner never show the progress dialog
+
+# Used in: src/ui/components.py (DynamicSearchFilterWidget) to free search results after the popup closes
+SEARCH_POPUP_IDLE_RELEASE_MS = 30000  # Clear hidden popup results after this long
+
+# Used in: src/ui/components.py (SearchableStaticFilterWidget) to filter once typing pauses
+STATIC_SEARCH_DEBOUNCE_MS = 150  # Delay between the last keystroke and filtering static data
+STATIC_SEARCH_MAX_RESULTS = 200  # Stop filtering static data after this many matches
+
+# Used in: src/ui/components.py (StaticFilterWidget) to coalesce chip rebuilds for bursts of combo box toggles
+CHIP_UPDATE_THROTTLE_MS = 30  # Delay before the chips are rebuilt; selectionChanged is not deferred
+
 # Drill Hole Trace Visualization Configuration
 # Used in: src/utils/qgis_helpers.py for assay data trace line visualization
 TRACE_SCALE_THRESHOLD = 50000  # Map scale at which trace lines become visible (1:50,000)
@@ -3,24 +3,114 @@ Custom UI components for the ND Data Importer plugin.
 Contains reusable widgets and layouts for the plugin interface.
 """
 
+from array import array
+from itertools import cycle, islice
+from operator import itemgetter
+
 from qgis.PyQt.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QLayout, QComboBox,
     QListView, QDialog, QLineEdit, QFormLayout, QDialogButtonBox, QMessageBox,
-    QColorDialog, QProgressDialog, QScrollArea, QFrame, QTableWidget, QTableWidgetItem, QHeaderView,
-    QSizePolicy, QToolButton, QDoubleSpinBox, QApplication
+    QColorDialog, QProgressDialog, QScrollArea, QFrame, QTableView, QHeaderView,
+    QSizePolicy, QToolButton, QDoubleSpinBox, QApplication, QWidgetItem, QButtonGroup
+)
+from qgis.PyQt.QtGui import QFont, QColor, QStandardItemModel, QStandardItem, QCursor, QIcon, QPainter
+from qgis.PyQt.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QRect, QSize, QTimer, QElapsedTimer, QSignalBlocker,
+    QAbstractListModel, QAbstractTableModel, QModelIndex, QRectF, QEvent
 )
-from qgis.PyQt.QtGui import QFont, QColor, QStandardItemModel, QStandardItem, QCursor, QIcon
-from qgis.PyQt.QtCore import Qt, pyqtSignal, QPoint, QRect, QSize, QEvent, QTimer
 from qgis.gui import QgsMapCanvas, QgsMapToolPan, QgsMapToolZoom, QgsMapTool, QgsRubberBand
 from qgis.core import (
     QgsVectorLayer, QgsProject, QgsCoordinateReferenceSystem, QgsRectangle,
-    QgsGeometry, QgsPointXY, QgsWkbTypes, QgsFeature, QgsFillSymbol, QgsRasterLayer
+    QgsGeometry, QgsWkbTypes, QgsFeature, QgsFillSymbol, QgsRasterLayer,
+    QgsCoordinateTransform, QgsMapSettings
 )
 
 from ..utils.logging import log_info, log_error, log_warning, log_debug
 from ..config.constants import (
-    MAX_SAFE_IMPORT, OSM_LAYER_NAME, OSM_LAYER_URL, PARTIAL_IMPORT_LIMIT, TRACE_SCALE_THRESHOLD
+    MAX_SAFE_IMPORT, OSM_LAYER_NAME, OSM_LAYER_URL, PARTIAL_IMPORT_LIMIT, TRACE_SCALE_THRESHOLD,
+    PROGRESS_UPDATE_INTERVAL_MS, SEARCH_POPUP_IDLE_RELEASE_MS, STATIC_SEARCH_DEBOUNCE_MS,
+    STATIC_SEARCH_MAX_RESULTS, MIN_TRACE_RANGES,
+    CHIP_UPDATE_THROTTLE_MS, IMPORT_PROGRESS_SHOW_DELAY_MS
 )
+from ..config.trace_ranges import (
+    TraceRange, BoundaryFormula, RangeType, TraceRangeConfiguration,
+    get_preset_by_name, get_available_presets, get_industry_standard_preset
+)
+
+
+# Dark theme probe results, keyed by the application's window colour
+_THEME_CACHE = {}
+
+
+def _is_dark_theme() -> bool:
+    """Return True if the application palette has a dark window colour.
+
+    Results are cached per window colour, so a palette change is picked up
+    on the next call without any signal or event hookup.
+    """
+    palette = QApplication.palette()
+    window_rgb = palette.color(palette.Window).rgb()
+    is_dark_theme = _THEME_CACHE.get(window_rgb)
+    if is_dark_theme is None:
+        is_dark_theme = QColor(window_rgb).lightness() < 128
+        _THEME_CACHE[window_rgb] = is_dark_theme
+    return is_dark_theme
+
+
+# Dialog button styles
+_BUTTON_QSS_DARK = """
+    QPushButton {
+        background-color: #3C3C3C;
+        color: #FFFFFF;
+        border: 1px solid #555555;
+        padding: 5px 15px;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #4A4A4A;
+        border: 1px solid #666666;
+    }
+    QPushButton:pressed {
+        background-color: #2A2A2A;
+    }
+    QPushButton:default {
+        background-color: #0D47A1;
+        border: 1px solid #1976D2;
+    }
+    QPushButton:default:hover {
+        background-color: #1565C0;
+        border: 1px solid #1E88E5;
+    }
+"""
+
+_BUTTON_QSS_LIGHT = """
+    QPushButton {
+        background-color: #F5F5F5;
+        color: #000000;
+        border: 1px solid #CCCCCC;
+        padding: 5px 15px;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #E0E0E0;
+        border: 1px solid #999999;
+    }
+    QPushButton:pressed {
+        background-color: #D5D5D5;
+    }
+    QPushButton:default {
+        background-color: #2196F3;
+        color: #FFFFFF;
+        border: 1px solid #1976D2;
+    }
+    QPushButton:default:hover {
+        background-color: #1E88E5;
+        border: 1px solid #1565C0;
+    }
+"""
+
+# Keyed by is_dark_theme
+_BUTTON_QSS = {True: _BUTTON_QSS_DARK, False: _BUTTON_QSS_LIGHT}
 
 
 def get_theme_aware_button_style() -> str:
@@ -29,65 +119,292 @@ def get_theme_aware_button_style() -> str:
     Returns:
         CSS stylesheet string for QPushButton
     """
-    palette = QApplication.palette()
-    window_color = palette.color(palette.Window)
-    is_dark_theme = window_color.lightness() < 128
+    return _BUTTON_QSS[_is_dark_theme()]
 
-    if is_dark_theme:
-        return """
-            QPushButton {
-                background-color: #3C3C3C;
-                color: #FFFFFF;
-                border: 1px solid #555555;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4A4A4A;
-                border: 1px solid #666666;
-            }
-            QPushButton:pressed {
-                background-color: #2A2A2A;
-            }
-            QPushButton:default {
-                background-color: #0D47A1;
-                border: 1px solid #1976D2;
-            }
-            QPushButton:default:hover {
-                background-color: #1565C0;
-                border: 1px solid #1E88E5;
-            }
-        """
-    else:
-        return """
-            QPushButton {
-                background-color: #F5F5F5;
-                color: #000000;
-                border: 1px solid #CCCCCC;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #E0E0E0;
-                border: 1px solid #999999;
-            }
-            QPushButton:pressed {
-                background-color: #D5D5D5;
-            }
-            QPushButton:default {
-                background-color: #2196F3;
-                color: #FFFFFF;
-                border: 1px solid #1976D2;
-            }
-            QPushButton:default:hover {
-                background-color: #1E88E5;
-                border: 1px solid #1565C0;
-            }
-        """
+
+# Default colour for imported points
+_DEFAULT_POINT_COLOR = QColor(255, 0, 0)
+
+# Shared bold fonts keyed by point size, created on first use because QFont
+# needs a running QApplication
+_BOLD_FONTS = {}
+
+
+def get_bold_font(point_size=None) -> QFont:
+    """Get a shared bold font for dialog titles and headers.
+
+    Args:
+        point_size: Font size in points, or None to keep the default size
+
+    Returns:
+        Cached QFont instance (widgets copy it in setFont, so it is never mutated)
+    """
+    font = _BOLD_FONTS.get(point_size)
+    if font is None:
+        font = QFont()
+        if point_size is not None:
+            font.setPointSize(point_size)
+        font.setBold(True)
+        _BOLD_FONTS[point_size] = font
+    return font
+
+
+# Chip colours per theme, keyed by is_dark_theme
+_CHIP_COLORS = {
+    True: {
+        'chip_bg': "#0D47A1",
+        'chip_border': "#1976D2",
+        'chip_text': "#E3F2FD",
+        'button_bg': "#E3F2FD",
+        'button_hover': "#BBDEFB",
+        'button_text': "#0D47A1",
+    },
+    False: {
+        'chip_bg': "#E3F2FD",
+        'chip_border': "#2196F3",
+        'chip_text': "#0D47A1",
+        'button_bg': "#1976D2",
+        'button_hover': "#1565C0",
+        'button_text': "#FFFFFF",
+    },
+}
+
+# Chips paint themselves; the stylesheet only sets their font
+_CHIP_QSS = """
+    Chip {
+        font-size: 11px;
+        font-weight: 500;
+    }
+"""
+
+_VIEW_ALL_QSS = """
+    ViewAllChip {
+        background-color: #d1e7ff;
+        border-radius: 8px;
+        border: 1px solid #4dabf7;
+    }
+    ViewAllChip:hover {
+        background-color: #a8d8ff;
+        cursor: pointer;
+    }
+"""
+
+
+# Chip stylesheet; it does not depend on the theme
+_CHIP_STYLESHEET = _CHIP_QSS + _VIEW_ALL_QSS
+
+
+def get_chip_stylesheet() -> str:
+    """Get the styling for Chip and ViewAllChip widgets.
+
+    Set once on the widget that hosts the chips so every chip inherits it
+    instead of parsing its own stylesheet.
+
+    Returns:
+        CSS stylesheet string for Chip and ViewAllChip
+    """
+    return _CHIP_STYLESHEET
+
+
+_CHIP_QCOLORS = {}
+
+
+def get_chip_colors() -> dict:
+    """Get the theme-aware chip colours as QColor objects.
+
+    Built once per theme and shared by every Chip.
+
+    Returns:
+        Dict with the same keys as _CHIP_COLORS, mapping to QColor
+    """
+    is_dark_theme = _is_dark_theme()
+    colors = _CHIP_QCOLORS.get(is_dark_theme)
+    if colors is None:
+        colors = {key: QColor(value) for key, value in _CHIP_COLORS[is_dark_theme].items()}
+        _CHIP_QCOLORS[is_dark_theme] = colors
+    return colors
+
+
+# Message bar background per message type, as (dark theme, light theme)
+_MSG_COLORS = {
+    'success': ("#2E7D32", "#4CAF50"),
+    'error': ("#C62828", "#f44336"),
+    'warning': ("#EF6C00", "#FF9800"),
+    'info': ("#1565C0", "#2196F3"),
+}
+
+# Message types styled like another type
+_MSG_TYPE_ALIASES = {'critical': 'error'}
+
+_MSG_QSS_TMPL = """
+    MessageBar[msgType="{msg_type}"], MessageBar[msgType="{msg_type}"] QWidget {{
+        background-color: {bg_color};
+        color: white;
+        padding: 8px;
+        border-radius: 4px;
+    }}
+"""
+
+_MSG_QSS = {
+    is_dark_theme: "".join(
+        _MSG_QSS_TMPL.format(msg_type=msg_type, bg_color=colors[0 if is_dark_theme else 1])
+        for msg_type, colors in _MSG_COLORS.items()
+    )
+    for is_dark_theme in (True, False)
+}
+
+
+# Search bar colours per theme, keyed by is_dark_theme
+_SEARCH_BAR_COLORS = {
+    True: {
+        'border_color': "#555555",
+        'bg_color': "#2b2b2b",
+        'text_color': "#E0E0E0",
+        'icon_color': "#888888",
+        'popup_bg': "#2b2b2b",
+        'popup_border': "#555555",
+        'item_text': "#E0E0E0",
+        'item_hover_bg': "#0D47A1",
+        'item_selected_bg': "#1565C0",
+    },
+    False: {
+        'border_color': "#C0C0C0",
+        'bg_color': "#FFFFFF",
+        'text_color': "#000000",
+        'icon_color': "#666666",
+        'popup_bg': "#FFFFFF",
+        'popup_border': "#C0C0C0",
+        'item_text': "#000000",
+        'item_hover_bg': "#E3F2FD",
+        'item_selected_bg': "#BBDEFB",
+    },
+}
+
+# Search icon, line edit, loading spinner and dropdown arrow of the search
+# widgets, matched by object name. A search box without an icon to its left
+# has the standalone property set and draws its own left edge.
+_SEARCH_BAR_QSS = """
+    QLabel#searchIcon {{
+        background-color: {bg_color};
+        color: {icon_color};
+        font-size: 12px;
+        padding: 0px;
+        border: 1px solid {border_color};
+        border-right: none;
+        border-top-left-radius: 4px;
+        border-bottom-left-radius: 4px;
+    }}
+    QLineEdit#searchBox {{
+        padding: 6px 8px;
+        border: 1px solid {border_color};
+        border-left: none;
+        border-right: none;
+        background-color: {bg_color};
+        color: {text_color};
+        font-size: 13px;
+    }}
+    QLineEdit#searchBox[standalone="true"] {{
+        border-left: 1px solid {border_color};
+        border-top-left-radius: 4px;
+        border-bottom-left-radius: 4px;
+    }}
+    QLineEdit#searchBox:hover {{
+        border-color: {border_color};
+    }}
+    QLineEdit#searchBox:focus {{
+        border-color: {border_color};
+        outline: none;
+    }}
+    QLabel#searchLoading {{
+        background-color: {bg_color};
+        color: red;
+        font-size: 24px;
+        border: 1px solid {border_color};
+        border-left: none;
+        border-top-right-radius: 4px;
+        border-bottom-right-radius: 4px;
+    }}
+    QLabel#searchDropdown {{
+        background-color: {bg_color};
+        color: {icon_color};
+        font-size: 10px;
+        padding: 0px;
+        border: 1px solid {border_color};
+        border-left: none;
+        border-top-right-radius: 4px;
+        border-bottom-right-radius: 4px;
+    }}
+"""
+
+# Results popup of SearchableStaticFilterWidget and its list
+_SEARCH_POPUP_QSS = """
+    QDialog {{
+        background-color: {popup_bg};
+        border: 1px solid {popup_border};
+        border-radius: 4px;
+    }}
+    QListView {{
+        background-color: {popup_bg};
+        color: {item_text};
+        border: none;
+        outline: none;
+        padding: 4px;
+        font-size: 13px;
+    }}
+    QListView::item {{
+        padding: 8px 10px;
+        border-radius: 3px;
+        margin: 2px;
+    }}
+    QListView::item:hover {{
+        background-color: {item_hover_bg};
+    }}
+    QListView::item:selected {{
+        background-color: {item_selected_bg};
+    }}
+"""
+
+# Formatted search stylesheets, keyed by (template, is_dark_theme)
+_SEARCH_STYLESHEETS = {}
+
+# Spinner frames of the search loading indicator
+_LOADING_FRAMES = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+
+
+def get_search_stylesheet(template: str) -> str:
+    """Get a search widget stylesheet formatted for the current theme.
+
+    Each template is formatted once per theme and the same string is handed
+    to every search widget.
+
+    Args:
+        template: _SEARCH_BAR_QSS or _SEARCH_POPUP_QSS
+
+    Returns:
+        CSS stylesheet string
+    """
+    key = (template, _is_dark_theme())
+    stylesheet = _SEARCH_STYLESHEETS.get(key)
+    if stylesheet is None:
+        stylesheet = template.format(**_SEARCH_BAR_COLORS[key[1]])
+        _SEARCH_STYLESHEETS[key] = stylesheet
+    return stylesheet
 
 
 class FlowLayout(QLayout):
-    """A custom layout that arranges widgets in a flowing manner."""
+    """A custom layout that arranges widgets in a flowing manner.
+
+    Item size hints are kept in parallel int arrays alongside itemList so a
+    layout pass only does integer arithmetic; they are re-read from Qt when
+    the layout is invalidated. heightForWidth results are memoized per
+    width, and minimumSize once, until the items or their size hints change.
+
+    Placement is incremental: the first _placed items are known to be laid
+    out for _last_rect, and the line state after each of them is kept, so
+    setGeometry resumes from the state after the last unchanged item instead
+    of reflowing everything. A size change moves the dirty marker back to
+    the changed item; a removal before it, or a new rect, resets it.
+    """
     
     def __init__(self, parent=None, margin=0, spacing=-1):
         super(FlowLayout, self).__init__(parent)
@@ -95,14 +412,39 @@ class FlowLayout(QLayout):
             self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing)
         self.itemList = []
-
-    def __del__(self):
-        item = self.takeAt(0)
-        while item:
-            item = self.takeAt(0)
+        self._widths = array('i')
+        self._heights = array('i')
+        self._hints_stale = False
+        # Incremental placement state
+        self._placed = 0  # Leading items already placed for _last_rect
+        self._last_rect = None
+        self._last_spacing = None
+        self._line_states = []  # (x, y, line_height) after each placed item
+        # heightForWidth memo, keyed on (width, _revision)
+        self._hfw_cache = {}
+        self._revision = 0
+        # minimumSize result, dropped with the memo or when the layout is invalidated
+        self._min_size = None
 
     def addItem(self, item):
+        size = item.sizeHint()
         self.itemList.append(item)
+        self._widths.append(size.width())
+        self._heights.append(size.height())
+        self._bump_revision()
+
+    def insertWidget(self, index, widget):
+        """Insert a widget at the given position in the flow."""
+        self.addChildWidget(widget)
+        item = QWidgetItem(widget)
+        size = item.sizeHint()
+        self.itemList.insert(index, item)
+        self._widths.insert(index, size.width())
+        self._heights.insert(index, size.height())
+        if index < self._placed:
+            self._placed = 0
+        self._bump_revision()
+        self.invalidate()
 
     def count(self):
         return len(self.itemList)
@@ -114,9 +456,48 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self.itemList):
+            del self._widths[index]
+            del self._heights[index]
+            if index < self._placed:
+                self._placed = 0
+            self._bump_revision()
             return self.itemList.pop(index)
         return None
 
+    def invalidate(self):
+        # Child size hints may have changed; re-read them on the next pass
+        self._hints_stale = True
+        self._min_size = None
+        super(FlowLayout, self).invalidate()
+
+    def _refresh_size_hints(self):
+        old_widths = self._widths
+        old_heights = self._heights
+        widths = array('i')
+        heights = array('i')
+        for item in self.itemList:
+            size = item.sizeHint()
+            widths.append(size.width())
+            heights.append(size.height())
+
+        # Only items from the first changed size onwards need placing again
+        for i in range(self._placed):
+            if widths[i] != old_widths[i] or heights[i] != old_heights[i]:
+                self._placed = i
+                break
+
+        if widths != old_widths or heights != old_heights:
+            self._bump_revision()
+
+        self._widths = widths
+        self._heights = heights
+        self._hints_stale = False
+
+    def _bump_revision(self):
+        self._revision += 1
+        self._hfw_cache.clear()
+        self._min_size = None
+
     def expandingDirections(self):
         return Qt.Orientations(Qt.Orientation(0))
 
@@ -124,7 +505,13 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        height = self._do_layout(QRect(0, 0, width, 0), True)
+        if self._hints_stale:
+            self._refresh_size_hints()
+        key = (width, self._revision)
+        height = self._hfw_cache.get(key)
+        if height is None:
+            height = self._do_layout(QRect(0, 0, width, 0), True)
+            self._hfw_cache[key] = height
         return height
 
     def setGeometry(self, rect):
@@ -135,124 +522,182 @@ class FlowLayout(QLayout):
         return self.minimumSize()
 
     def minimumSize(self):
-        size = QSize()
-        for item in self.itemList:
-            size = size.expandedTo(item.minimumSize())
-        margin, _, _, _ = self.getContentsMargins()
-        size += QSize(2 * margin, 2 * margin)
-        return size
+        if self._min_size is None:
+            size = QSize()
+            for item in self.itemList:
+                size = size.expandedTo(item.minimumSize())
+            margin, _, _, _ = self.getContentsMargins()
+            size += QSize(2 * margin, 2 * margin)
+            self._min_size = size
+        return QSize(self._min_size)
 
     def _do_layout(self, rect, test_only):
-        x = rect.x()
-        y = rect.y()
-        line_height = 0
-        space_x = self.spacing()
-        space_y = self.spacing()
-
-        for item in self.itemList:
-            next_x = x + item.sizeHint().width() + space_x
-            if next_x - space_x > rect.right() and line_height > 0:
-                x = rect.x()
-                y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
+        if self._hints_stale:
+            self._refresh_size_hints()
+
+        # Read everything from Qt once up front; the loop itself only does
+        # plain int arithmetic over the cached size hints
+        left = rect.x()
+        top = rect.y()
+        right = rect.right()
+        spacing = self.spacing()
+
+        # Resume after the last item that is still in place, if any
+        start = 0
+        x, y, line_height = left, top, 0
+        if (not test_only and self._placed and rect == self._last_rect
+                and spacing == self._last_spacing):
+            start = self._placed
+            x, y, line_height = self._line_states[start - 1]
+        line_states = self._line_states
+        if not test_only:
+            del line_states[start:]
+
+        items = self.itemList
+        widths = self._widths
+        heights = self._heights
+        for i in range(start, len(items)):
+            width = widths[i]
+            height = heights[i]
+            next_x = x + width + spacing
+            if next_x - spacing > right and line_height > 0:
+                x = left
+                y = y + line_height + spacing
+                next_x = x + width + spacing
                 line_height = 0
             if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                items[i].setGeometry(QRect(x, y, width, height))
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
-        return y + line_height - rect.y()
+            if height > line_height:
+                line_height = height
+            if not test_only:
+                line_states.append((x, y, line_height))
+
+        if not test_only:
+            self._placed = len(items)
+            self._last_rect = QRect(rect)
+            self._last_spacing = spacing
+        return y + line_height - top
 
 class Chip(QWidget):
-    """A widget representing a single selected item, with a close button."""
+    """A widget representing a single selected item, with a close control.
+
+    The chip has no layout or child widgets: it paints its rounded background,
+    text and "×" close glyph itself in the theme colours from
+    get_chip_colors(), so even very large selections are cheap to build and
+    lay out. Clicking the glyph emits removed. Its font comes from the
+    container's stylesheet, see get_chip_stylesheet().
+    """
 
     removed = pyqtSignal(object)
 
+    LEFT_MARGIN = 6
+    RIGHT_MARGIN = 2
+    VERTICAL_MARGIN = 2
+    SPACING = 4
+    CLOSE_SIZE = 14
+
     def __init__(self, text, data, parent=None):
         super().__init__(parent)
         self.data = data
         self.text = text
+        self._colors = get_chip_colors()
+        self._close_rect = QRect()
+        self._close_hovered = False
+        self._size_hint = None  # Measured on first use, dropped when text or font change
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        # Needed to highlight the close glyph on hover
+        self.setMouseTracking(True)
+
+    def setText(self, text):
+        """Change the chip text."""
+        self.text = text
+        self._size_hint = None
+        self.updateGeometry()
+        self.update()
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(6, 2, 2, 2)
-        layout.setSpacing(4)
+    def sizeHint(self):
+        if self._size_hint is None:
+            metrics = self.fontMetrics()
+            # horizontalAdvance needs Qt 5.11; early QGIS 3 builds ship Qt 5.9
+            if hasattr(metrics, 'horizontalAdvance'):
+                text_width = metrics.horizontalAdvance(self.text)
+            else:
+                text_width = metrics.width(self.text)
+            width = self.LEFT_MARGIN + text_width + self.SPACING + self.CLOSE_SIZE + self.RIGHT_MARGIN
+            height = max(metrics.height(), self.CLOSE_SIZE) + 2 * self.VERTICAL_MARGIN
+            self._size_hint = QSize(width, height)
+        return QSize(self._size_hint)
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def changeEvent(self, event):
+        # The font arrives with the container's stylesheet when the chip is polished
+        if event.type() == QEvent.FontChange:
+            self._size_hint = None
+            self.updateGeometry()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        self._close_rect = QRect(
+            self.width() - self.RIGHT_MARGIN - self.CLOSE_SIZE,
+            (self.height() - self.CLOSE_SIZE) // 2,
+            self.CLOSE_SIZE, self.CLOSE_SIZE
+        )
+        super().resizeEvent(event)
 
-        self.label = QLabel(text, self)
+    def paintEvent(self, event):
+        colors = self._colors
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        self.close_button = QPushButton("×", self)
-        self.close_button.setFixedSize(14, 14)
-        self.close_button.setDefault(False)
-        self.close_button.setAutoDefault(False)
-
-        # Detect theme (dark or light)
-        from qgis.PyQt.QtWidgets import QApplication
-        palette = QApplication.palette()
-        window_color = palette.color(palette.Window)
-        is_dark_theme = window_color.lightness() < 128
-
-        # Theme-aware button styling with proper contrast
-        if is_dark_theme:
-            button_bg = "#E3F2FD"
-            button_hover = "#BBDEFB"
-            button_pressed = "#90CAF9"
-            button_text = "#0D47A1"
-        else:
-            button_bg = "#1976D2"
-            button_hover = "#1565C0"
-            button_pressed = "#0D47A1"
-            button_text = "#FFFFFF"
-
-        self.close_button.setStyleSheet(f"""
-            QPushButton {{
-                font-family: "Arial", sans-serif;
-                font-weight: bold;
-                border-radius: 7px;
-                border: none;
-                background-color: {button_bg};
-                color: {button_text};
-                font-size: 11px;
-                padding: 0px;
-            }}
-            QPushButton:hover {{
-                background-color: {button_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {button_pressed};
-            }}
-        """)
-        self.close_button.clicked.connect(self._emit_removed_signal)
+        painter.setPen(colors['chip_border'])
+        painter.setBrush(colors['chip_bg'])
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
 
-        layout.addWidget(self.label)
-        layout.addWidget(self.close_button)
+        painter.setPen(colors['chip_text'])
+        text_rect = QRect(self.LEFT_MARGIN, 0, self._close_rect.left() - self.SPACING - self.LEFT_MARGIN, self.height())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, self.text)
 
-        # Theme-aware chip styling with blue accent
-        if is_dark_theme:
-            chip_bg = "#0D47A1"
-            chip_border = "#1976D2"
-            chip_text = "#E3F2FD"
-        else:
-            chip_bg = "#E3F2FD"
-            chip_border = "#2196F3"
-            chip_text = "#0D47A1"
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(colors['button_hover'] if self._close_hovered else colors['button_bg'])
+        painter.drawEllipse(self._close_rect)
+        painter.setPen(colors['button_text'])
+        painter.drawText(self._close_rect, Qt.AlignCenter, "×")
+        painter.end()
 
-        self.setStyleSheet(f"""
-            Chip {{
-                background-color: {chip_bg};
-                border-radius: 10px;
-                border: 1px solid {chip_border};
-            }}
-            Chip QLabel {{
-                color: {chip_text};
-                font-size: 11px;
-                font-weight: 500;
-            }}
-        """)
+    def mousePressEvent(self, event):
+        """Emit removed when the close glyph is clicked."""
+        if event.button() == Qt.LeftButton and self._close_rect.contains(event.pos()):
+            self.removed.emit(self.data)
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        self._set_close_hovered(self._close_rect.contains(event.pos()))
+        super().mouseMoveEvent(event)
 
-    def _emit_removed_signal(self):
-        """Emit the removed signal with this chip's data."""
-        self.removed.emit(self.data)
+    def leaveEvent(self, event):
+        self._set_close_hovered(False)
+        super().leaveEvent(event)
+
+    def _set_close_hovered(self, hovered):
+        """Track whether the pointer is over the close glyph, repainting only on change."""
+        if hovered == self._close_hovered:
+            return
+        self._close_hovered = hovered
+        if hovered:
+            self.setCursor(Qt.PointingHandCursor)
+        else:
+            self.unsetCursor()
+        self.update(self._close_rect)
 
 class ViewAllChip(QWidget):
-    """A chip-like widget that looks like a chip but shows 'view all' functionality."""
+    """A chip-like widget that looks like a chip but shows 'view all' functionality.
+
+    Styled by its container through get_chip_stylesheet(), like Chip.
+    """
 
     clicked = pyqtSignal()
 
@@ -267,35 +712,71 @@ class ViewAllChip(QWidget):
         self.label = QLabel(text, self)
         layout.addWidget(self.label)
 
-        self.setStyleSheet("""
-            ViewAllChip {
-                background-color: #d1e7ff;
-                border-radius: 8px;
-                border: 1px solid #4dabf7;
-            }
-            ViewAllChip:hover {
-                background-color: #a8d8ff;
-                cursor: pointer;
-            }
-        """)
-
     def mousePressEvent(self, event):
         """Handle mouse press to emit clicked signal."""
         if event.button() == Qt.LeftButton:
             self.clicked.emit()
         super().mousePressEvent(event)
 
+
+def sync_chip_layout(layout, chip_by_data, items, on_removed):
+    """Bring the chips in a FlowLayout in line with items, touching only what changed.
+
+    Chips whose data is no longer wanted are deleted, new ones are inserted at
+    their position and existing ones are kept (moved or relabelled if needed).
+
+    Args:
+        layout: FlowLayout whose leading positions hold the chips
+        chip_by_data: Dict of data -> Chip currently in the layout, updated in place
+        items: Ordered list of (data, text) pairs to display
+        on_removed: Slot connected to the removed signal of newly created chips
+    """
+    wanted = {data for data, _ in items}
+    for data in [data for data in chip_by_data if data not in wanted]:
+        chip = chip_by_data.pop(data)
+        layout.removeWidget(chip)
+        chip.deleteLater()
+
+    for index, (data, text) in enumerate(items):
+        chip = chip_by_data.get(data)
+        if chip is None:
+            chip = Chip(text, data)
+            chip.removed.connect(on_removed)
+            chip_by_data[data] = chip
+            layout.insertWidget(index, chip)
+            continue
+        current = layout.itemAt(index)
+        if current is None or current.widget() is not chip:
+            layout.removeWidget(chip)
+            layout.insertWidget(index, chip)
+        if chip.text != text:
+            chip.setText(text)
+
 class MessageBar(QWidget):
-    """A message bar widget that shows messages with different types (info, success, warning, error)."""
+    """A message bar widget that shows messages with different types (info, success, warning, error).
+
+    All four colour variants live in one stylesheet keyed on the msgType
+    property, so showing a message only switches the property.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setVisible(False)  # Hidden by default
+        self._is_dark_theme = None
+        # Messages shown in quick succession are applied once, latest wins
+        self._pending_message = None
         try:
             self.hide_timer = QTimer()
             self.hide_timer.setSingleShot(True)
             self.hide_timer.timeout.connect(self.hide_message)
+            self._show_timer = QTimer(self)
+            self._show_timer.setSingleShot(True)
+            self._show_timer.setInterval(0)
+            self._show_timer.timeout.connect(self._apply_pending_message)
             self.setupUI()
+            # Parse the stylesheet up front so showing a message never has to
+            self.setProperty("msgType", "info")
+            self._apply_theme_stylesheet()
         except Exception as e:
             # If there's an error setting up MessageBar, just create a basic QLabel as fallback
             layout = QHBoxLayout(self)
@@ -318,8 +799,33 @@ class MessageBar(QWidget):
         self.close_button.clicked.connect(self.hide_message)
         layout.addWidget(self.close_button)
 
+    def _apply_theme_stylesheet(self):
+        """Set the stylesheet for the current theme if it is not already applied."""
+        is_dark_theme = _is_dark_theme()
+        if is_dark_theme != self._is_dark_theme:
+            self._is_dark_theme = is_dark_theme
+            self.setStyleSheet(_MSG_QSS[is_dark_theme])
+
     def show_message(self, message, message_type="info", duration=3000):
-        """Show a message with specified type and duration."""
+        """Show a message with specified type and duration.
+
+        The message is applied on the next event loop pass, so a burst of
+        calls only styles and lays out the bar for the last one.
+        """
+        self._pending_message = (message, message_type, duration)
+        if hasattr(self, '_show_timer'):
+            self._show_timer.start()
+        else:
+            # Fallback if setup failed before the timer was created
+            self._apply_pending_message()
+
+    @pyqtSlot()
+    def _apply_pending_message(self):
+        """Display the most recent message passed to show_message."""
+        if self._pending_message is None:
+            return
+        message, message_type, duration = self._pending_message
+        self._pending_message = None
         try:
             if hasattr(self, 'message_label'):
                 self.message_label.setText(f"[{message_type.upper()}] {message}")
@@ -327,26 +833,22 @@ class MessageBar(QWidget):
                 # Fallback if setupUI failed
                 return
 
-            # Detect theme for appropriate styling
-            from PyQt5.QtWidgets import QApplication
-            palette = QApplication.palette()
-            window_color = palette.color(palette.Window)
-            is_dark_theme = window_color.lightness() < 128
+            # Follow theme changes; the stylesheet is only replaced when the theme differs
+            self._apply_theme_stylesheet()
 
             # Theme-aware styling based on message type
             # Message bars should be bright enough to stand out in both themes
-            if message_type.lower() == "success":
-                bg_color = "#2E7D32" if is_dark_theme else "#4CAF50"
-                self.setStyleSheet(f"background-color: {bg_color}; color: white; padding: 8px; border-radius: 4px;")
-            elif message_type.lower() == "error" or message_type.lower() == "critical":
-                bg_color = "#C62828" if is_dark_theme else "#f44336"
-                self.setStyleSheet(f"background-color: {bg_color}; color: white; padding: 8px; border-radius: 4px;")
-            elif message_type.lower() == "warning":
-                bg_color = "#EF6C00" if is_dark_theme else "#FF9800"
-                self.setStyleSheet(f"background-color: {bg_color}; color: white; padding: 8px; border-radius: 4px;")
-            else:  # info
-                bg_color = "#1565C0" if is_dark_theme else "#2196F3"
-                self.setStyleSheet(f"background-color: {bg_color}; color: white; padding: 8px; border-radius: 4px;")
+            msg_type = message_type.lower()
+            msg_type = _MSG_TYPE_ALIASES.get(msg_type, msg_type)
+            if msg_type not in _MSG_COLORS:
+                msg_type = "info"
+
+            if self.property("msgType") != msg_type:
+                self.setProperty("msgType", msg_type)
+                # Re-polish so the property selectors are re-evaluated
+                for widget in (self, self.message_label, self.close_button):
+                    widget.style().unpolish(widget)
+                    widget.style().polish(widget)
 
             self.setVisible(True)
 
@@ -359,8 +861,10 @@ class MessageBar(QWidget):
                 self.message_label.setText(message)
                 self.setVisible(True)
 
+    @pyqtSlot()
     def hide_message(self):
         """Hide the message bar."""
+        self._pending_message = None
         try:
             if hasattr(self, 'hide_timer'):
                 self.hide_timer.stop()
@@ -380,6 +884,7 @@ class AllSelectedItemsDialog(QDialog):
         self.setModal(True)
         self.setMinimumSize(400, 300)
         self.selected_items = selected_items.copy()  # Make a copy to avoid modifying original
+        self._chip_by_data = {}
 
         self.setupUI()
 
@@ -387,12 +892,9 @@ class AllSelectedItemsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Title
-        title_label = QLabel(f"Selected Companies ({len(self.selected_items)})")
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
+        self.title_label = QLabel(f"Selected Companies ({len(self.selected_items)})")
+        self.title_label.setFont(get_bold_font(12))
+        layout.addWidget(self.title_label)
 
         # Scroll area for chips
         scroll_area = QScrollArea(self)
@@ -401,9 +903,10 @@ class AllSelectedItemsDialog(QDialog):
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
         # Container widget for chips
-        container_widget = QWidget()
-        self.container_layout = FlowLayout(container_widget, spacing=4)
-        scroll_area.setWidget(container_widget)
+        self.container_widget = QWidget()
+        self.container_widget.setStyleSheet(get_chip_stylesheet())
+        self.container_layout = FlowLayout(self.container_widget, spacing=4)
+        scroll_area.setWidget(self.container_widget)
 
         layout.addWidget(scroll_area)
 
@@ -416,30 +919,114 @@ class AllSelectedItemsDialog(QDialog):
         layout.addWidget(button_box)
 
     def update_chips_display(self):
-        """Update the chip display in the dialog."""
-        # Clear existing chips
-        while self.container_layout.count():
-            child = self.container_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        # Add chips for all selected items
-        for data, text in self.selected_items.items():
-            chip = Chip(text, data)
-            chip.removed.connect(self.on_chip_removed)
-            self.container_layout.addWidget(chip)
+        """Update the chip display in the dialog, only adding or removing changed chips."""
+        self.container_widget.setUpdatesEnabled(False)
+        try:
+            sync_chip_layout(
+                self.container_layout, self._chip_by_data,
+                list(self.selected_items.items()), self.on_chip_removed
+            )
+        finally:
+            self.container_widget.setUpdatesEnabled(True)
 
+    @pyqtSlot(object)
     def on_chip_removed(self, data):
         """Handle chip removal from the dialog."""
         if data in self.selected_items:
             del self.selected_items[data]
             self.item_removed.emit(data)
-            self.update_chips_display()
+            # Only this chip goes; the rest keep their order, so no full sync is needed
+            chip = self._chip_by_data.pop(data, None)
+            if chip is not None:
+                self.container_layout.removeWidget(chip)
+                chip.deleteLater()
 
             # Update title
-            title_label = self.findChild(QLabel)
-            if title_label:
-                title_label.setText(f"Selected Companies ({len(self.selected_items)})")
+            self.title_label.setText(f"Selected Companies ({len(self.selected_items)})")
+
+class CheckableListModel(QAbstractListModel):
+    """List model over (text, data) rows with a check state per row.
+
+    Rows are kept as plain tuples and their check states in a bytearray, so
+    long lists need no per-row item objects.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._checked = bytearray()
+        self._row_by_data = {}
+
+    def append_rows(self, rows, checked_data=()):
+        """Append (text, data) rows, checking those whose data is in checked_data."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for row, (text, data) in enumerate(rows, first):
+            self._rows.append((text, data))
+            self._checked.append(data in checked_data)
+            self._row_by_data[data] = row
+        self.endInsertRows()
+
+    def has_data(self, data):
+        """Return True if a row holds the given data."""
+        return data in self._row_by_data
+
+    def data_at(self, row):
+        """Return the data of the given row."""
+        return self._rows[row][1]
+
+    def text_for_data(self, data):
+        """Return the text of the row holding data, or None if there is none."""
+        row = self._row_by_data.get(data)
+        return self._rows[row][0] if row is not None else None
+
+    def is_checked(self, row):
+        """Return True if the given row is checked."""
+        return bool(self._checked[row])
+
+    def set_checked(self, data, checked):
+        """Set the check state of the row holding data, if there is one."""
+        row = self._row_by_data.get(data)
+        if row is None or self._checked[row] == checked:
+            return
+        self._checked[row] = checked
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._rows[row][0]
+        if role == Qt.UserRole:
+            return self._rows[row][1]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[row] else Qt.Unchecked
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._rows[row:row + count]
+        del self._checked[row:row + count]
+        self._row_by_data = {data: i for i, (_, data) in enumerate(self._rows)}
+        self.endRemoveRows()
+        return True
+
 
 class CheckableComboBox(QComboBox):
     """A combo box that allows multiple selections with checkboxes."""
@@ -452,48 +1039,49 @@ class CheckableComboBox(QComboBox):
         self.setEditable(True)
         self.lineEdit().setReadOnly(True)
 
-        self.setModel(QStandardItemModel(self))
+        self.setModel(CheckableListModel(self))
 
         # Connect to view pressed signal for item interaction
         # This is more reliable than clicked for checkboxes
         self.view().pressed.connect(self.handleItemPressed)
 
-        self._selected_data = []
+        self._selected_data = {}  # Selected data values as ordered dict keys for O(1) membership
         self._updating_internally = False  # Flag to prevent recursive updates
 
         self.lineEdit().setPlaceholderText("Select items...")
         self.lineEdit().setText("")
 
+    @pyqtSlot('QModelIndex')
     def handleItemPressed(self, index):
         """Handle item press to toggle checkbox state."""
-        if self._updating_internally:
+        if self._updating_internally or not index.isValid():
             return
 
-        item = self.model().itemFromIndex(index)
-        if not item:
-            return
+        model = self.model()
+        item_data = model.data_at(index.row())
 
         # Toggle the checkbox state
-        if item.checkState() == Qt.Checked:
-            item.setCheckState(Qt.Unchecked)
-        else:
-            item.setCheckState(Qt.Checked)
-
-        # Handle "All States" logic
-        item_data = item.data(Qt.UserRole)
-        if item_data == "":  # "All States" selected
-            if item.checkState() == Qt.Checked:
-                # Uncheck all other items when "All States" is selected
-                for i in range(self.model().rowCount()):
-                    other_item = self.model().item(i)
-                    if other_item and other_item.data(Qt.UserRole) != "":
-                        other_item.setCheckState(Qt.Unchecked)
+        checked = not model.is_checked(index.row())
+        model.set_checked(item_data, checked)
+
+        # Keep the selection in step with the check states instead of rescanning the model
+        if not checked:
+            self._selected_data.pop(item_data, None)
+        elif item_data == "":  # "All States" selected
+            # Uncheck all other items when "All States" is selected. Clear
+            # them silently and repaint the view once.
+            if self._selected_data:
+                with QSignalBlocker(model):
+                    for data in self._selected_data:
+                        model.set_checked(data, False)
+                self._emit_check_states_changed()
+            self._selected_data = {item_data: None}
         else:
             # If any specific state is selected, uncheck "All States"
-            if item.checkState() == Qt.Checked:
-                all_states_item = self.model().item(0)
-                if all_states_item and all_states_item.data(Qt.UserRole) == "":
-                    all_states_item.setCheckState(Qt.Unchecked)
+            if "" in self._selected_data:
+                model.set_checked("", False)
+                del self._selected_data[""]
+            self._selected_data[item_data] = None
 
         self._update_selection()
 
@@ -502,12 +1090,7 @@ class CheckableComboBox(QComboBox):
         super().hidePopup()
 
     def _update_selection(self):
-        """Update internal selection list and emit signal."""
-        self._selected_data = []
-        for i in range(self.model().rowCount()):
-            item = self.model().item(i)
-            if item and item.checkState() == Qt.Checked:
-                self._selected_data.append(item.data(Qt.UserRole))
+        """Refresh the display text and emit the current selection."""
         self.updateDisplayText()
         self.selectionChanged.emit(self.currentData())
 
@@ -517,45 +1100,170 @@ class CheckableComboBox(QComboBox):
         if count == 0:
             self.lineEdit().setText("")
         elif count == 1:
-            for i in range(self.model().rowCount()):
-                item = self.model().item(i)
-                if item.data(Qt.UserRole) == self._selected_data[0]:
-                    self.lineEdit().setText(item.text())
-                    return
+            self.lineEdit().setText(self.textForData(next(iter(self._selected_data))))
         else:
             self.lineEdit().setText(f"{count} items selected")
 
     def addItem(self, text, userData=None):
         """Add an item with optional user data."""
-        item = QStandardItem(text)
-        item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-        item.setData(userData or text, Qt.UserRole)
-        item.setCheckState(Qt.Checked if (userData or text) in self._selected_data else Qt.Unchecked)
-        self.model().appendRow(item)
-    
+        self.model().append_rows([(text, userData or text)], self._selected_data)
+
     def addItems(self, items):
         """Add multiple items from a list of (text, data) tuples."""
-        for text, data in items:
-            self.addItem(text, data)
+        # One insert for all rows, so views see a single rowsInserted
+        self.model().append_rows([(text, data or text) for text, data in items], self._selected_data)
     
     def currentData(self):
         """Return the list of selected data values."""
-        return self._selected_data
+        return list(self._selected_data)
+
+    def isDataSelected(self, data):
+        """Return True if the item with the given data is checked."""
+        return data in self._selected_data
+
+    def textForData(self, data):
+        """Return the display text of the item with the given data, or "" if there is none."""
+        text = self.model().text_for_data(data)
+        return text if text is not None else ""
 
     def setCurrentData(self, data_list):
         """Set the current selection by data values."""
         if not isinstance(data_list, list):
             data_list = []
 
+        model = self.model()
+        # Only values that have an item can end up checked
+        selected_data = {data: None for data in data_list if model.has_data(data)}
+        previous_data = self._selected_data
+        # Nothing to update or announce when the selection (and its order) is unchanged
+        if list(selected_data) == list(previous_data):
+            return
+
         self._updating_internally = True
-        self._selected_data = data_list
-        for i in range(self.model().rowCount()):
-            item = self.model().item(i)
-            if item:
-                item.setCheckState(Qt.Checked if item.data(Qt.UserRole) in data_list else Qt.Unchecked)
+        self._selected_data = selected_data
+        # Check states always mirror _selected_data, so only the items that
+        # enter or leave the selection need touching. Apply them silently,
+        # then tell the view once.
+        with QSignalBlocker(model):
+            for data in previous_data:
+                if data not in selected_data:
+                    model.set_checked(data, False)
+            for data in selected_data:
+                if data not in previous_data:
+                    model.set_checked(data, True)
+        self._emit_check_states_changed()
         self._updating_internally = False
         self._update_selection()
 
+    def _emit_check_states_changed(self):
+        """Notify views that check states of all rows changed (after a blocked bulk update)."""
+        model = self.model()
+        row_count = model.rowCount()
+        if row_count:
+            model.dataChanged.emit(model.index(0, 0), model.index(row_count - 1, 0), [Qt.CheckStateRole])
+
+class SearchPopup(QDialog):
+    """Results popup for the search widgets that hands typing back to the search box.
+
+    The popup and its list never take focus, so key presses arrive here
+    directly; Escape closes the popup and everything else is forwarded.
+    """
+
+    escape_pressed = pyqtSignal()
+    visibility_changed = pyqtSignal(bool)
+
+    def __init__(self, search_box, parent=None):
+        super().__init__(parent, Qt.Popup)
+        self._search_box = search_box
+        # Prevent the popup dialog from taking keyboard focus
+        self.setFocusPolicy(Qt.NoFocus)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.hide()
+            self.escape_pressed.emit()
+            return
+
+        # Hand key presses straight to the search box; it is the only
+        # receiver, so the application-wide event filter chain is skipped
+        if self._search_box.isVisible() and self._search_box.isEnabled():
+            self._search_box.event(event)
+            return
+        super().keyPressEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+
+class SearchResultsModel(QAbstractListModel):
+    """Read-only list model over (text, data) result tuples.
+
+    Rows are exposed to the view in batches through canFetchMore/fetchMore,
+    so only the rows that are scrolled into view are ever materialized.
+    """
+
+    FETCH_BATCH_SIZE = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._loaded = 0
+
+    def set_rows(self, rows):
+        """Replace all results."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._loaded = min(len(self._rows), self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def total_rows(self):
+        """Return the number of results, including ones not fetched yet."""
+        return len(self._rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        text, data = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.UserRole:
+            return data
+        return None
+
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._rows)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(len(self._rows) - self._loaded, self.FETCH_BATCH_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or count <= 0 or row + count > self._loaded:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._rows[row:row + count]
+        self._loaded -= count
+        self.endRemoveRows()
+        return True
+
+
 class DynamicSearchFilterWidget(QWidget):
     """A widget for live search functionality with a results popup and chip display."""
     
@@ -565,6 +1273,11 @@ class DynamicSearchFilterWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._selected_items = {}
+        self._chip_by_data = {}  # data -> Chip currently shown
+        self._view_all_chip = None
+        self._rendered_chips = None  # (shown (data, text) pairs, hidden count) last applied by _updateChips
+        self._bulk = False  # Set between begin_bulk() and end_bulk()
+        self._bulk_dirty = False
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -576,103 +1289,37 @@ class DynamicSearchFilterWidget(QWidget):
         search_layout = QHBoxLayout(search_container)
         search_layout.setContentsMargins(0, 0, 0, 0)
         search_layout.setSpacing(0)
-
-        # Detect theme for styling
-        from qgis.PyQt.QtWidgets import QApplication
-        palette = QApplication.palette()
-        window_color = palette.color(palette.Window)
-        is_dark_theme = window_color.lightness() < 128
-
-        # Theme-aware colors
-        if is_dark_theme:
-            border_color = "#555555"
-            bg_color = "#2b2b2b"
-            text_color = "#E0E0E0"
-            icon_color = "#888888"
-        else:
-            border_color = "#C0C0C0"
-            bg_color = "#FFFFFF"
-            text_color = "#000000"
-            icon_color = "#666666"
+        # One theme-aware stylesheet styles every part of the search bar
+        search_container.setStyleSheet(get_search_stylesheet(_SEARCH_BAR_QSS))
 
         # Search icon label (left side)
         self.search_icon = QLabel("🔍", search_container)
+        self.search_icon.setObjectName("searchIcon")
         self.search_icon.setFixedWidth(28)
         self.search_icon.setAlignment(Qt.AlignCenter)
-        self.search_icon.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {icon_color};
-                font-size: 12px;
-                padding: 0px;
-                border: 1px solid {border_color};
-                border-right: none;
-                border-top-left-radius: 4px;
-                border-bottom-left-radius: 4px;
-            }}
-        """)
 
         self.search_box = QLineEdit(search_container)
+        self.search_box.setObjectName("searchBox")
         self.search_box.setPlaceholderText("Type to search...")
         self.search_box.textChanged.connect(self.textChanged.emit)
-        self.search_box.setStyleSheet(f"""
-            QLineEdit {{
-                padding: 6px 8px;
-                border: 1px solid {border_color};
-                border-left: none;
-                border-right: none;
-                background-color: {bg_color};
-                color: {text_color};
-                font-size: 13px;
-            }}
-            QLineEdit:hover {{
-                border-color: {border_color};
-            }}
-            QLineEdit:focus {{
-                border-color: {border_color};
-                outline: none;
-            }}
-        """)
 
         # Create loading indicator (circular spinner) - positioned on the right
-        self.loading_label = QLabel(self)
+        self.loading_label = QLabel(search_container)
+        self.loading_label.setObjectName("searchLoading")
         self.loading_label.setFixedSize(30, 30)
         self.loading_label.setAlignment(Qt.AlignCenter)
         self.loading_label.setVisible(False)
-        self.loading_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: red;
-                font-size: 24px;
-                border: 1px solid {border_color};
-                border-left: none;
-                border-top-right-radius: 4px;
-                border-bottom-right-radius: 4px;
-            }}
-        """)
 
         # Create a simple animated loading indicator using Unicode spinner
         self.loading_timer = QTimer(self)
         self.loading_timer.timeout.connect(self._update_loading_animation)
-        self.loading_frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-        self.loading_frame_index = 0
+        self._loading_frames = cycle(_LOADING_FRAMES)
 
         # Dropdown arrow icon label (right side, hidden when loading)
         self.dropdown_icon = QLabel("▼", search_container)
+        self.dropdown_icon.setObjectName("searchDropdown")
         self.dropdown_icon.setFixedWidth(28)
         self.dropdown_icon.setAlignment(Qt.AlignCenter)
-        self.dropdown_icon.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {icon_color};
-                font-size: 10px;
-                padding: 0px;
-                border: 1px solid {border_color};
-                border-left: none;
-                border-top-right-radius: 4px;
-                border-bottom-right-radius: 4px;
-            }}
-        """)
 
         search_layout.addWidget(self.search_icon)
         search_layout.addWidget(self.search_box)
@@ -682,35 +1329,58 @@ class DynamicSearchFilterWidget(QWidget):
         main_layout.addWidget(search_container)
 
         self.chip_container = QWidget(self)
+        self.chip_container.setStyleSheet(get_chip_stylesheet())
         self.chip_layout = FlowLayout(self.chip_container, spacing=4)
         self.chip_container.setVisible(False)
         main_layout.addWidget(self.chip_container)
 
-        self.popup = QDialog(self, Qt.Popup)
+        # Results popup is built on first use (see _ensure_popup)
+        self.popup = None
+        self.results_list = None
+
+        # Frees the results model once the popup has been hidden for a while
+        self._popup_idle_timer = QTimer(self)
+        self._popup_idle_timer.setSingleShot(True)
+        self._popup_idle_timer.setInterval(SEARCH_POPUP_IDLE_RELEASE_MS)
+        self._popup_idle_timer.timeout.connect(self._release_popup_results)
+
+    def _ensure_popup(self):
+        """Create the results popup the first time it is needed."""
+        if self.popup is not None:
+            return
+
+        self.popup = SearchPopup(self.search_box, self)
+        self.popup.escape_pressed.connect(self._on_popup_escape)
+        self.popup.visibility_changed.connect(self._on_popup_visibility_changed)
         self.popup_layout = QVBoxLayout(self.popup)
         self.results_list = QListView(self.popup)
-        self.results_list.setModel(QStandardItemModel(self.results_list))
+        self.results_list.setModel(SearchResultsModel(self.results_list))
+        # All rows are single-line text, so let the view lay them out
+        # without measuring every row individually
+        self.results_list.setUniformItemSizes(True)
         self.results_list.clicked.connect(self.onResultClicked)
         # Prevent the list from taking keyboard focus
         self.results_list.setFocusPolicy(Qt.NoFocus)
         self.popup_layout.addWidget(self.results_list)
         self.popup.setMinimumWidth(300)
-        # Prevent the popup dialog from taking keyboard focus
-        self.popup.setFocusPolicy(Qt.NoFocus)
-        # Install event filter on the popup to redirect keyboard events
-        self.popup.installEventFilter(self)
-        self.results_list.installEventFilter(self)
 
+    @pyqtSlot()
+    def _release_popup_results(self):
+        """Drop the results of a popup that has stayed hidden."""
+        if self.popup is not None and not self.popup.isVisible():
+            self.results_list.model().set_rows([])
+
+    @pyqtSlot('QModelIndex')
     def onResultClicked(self, index):
         """Handle result click to add selected item."""
-        item = self.results_list.model().itemFromIndex(index)
-        if item:
-            self.addItem(item.text(), item.data(Qt.UserRole))
+        model = self.results_list.model()
+        if index.isValid():
+            self.addItem(index.data(Qt.DisplayRole), index.data(Qt.UserRole))
             # Remove the selected item from the current results to avoid re-selection
-            self.results_list.model().removeRow(index.row())
+            model.removeRow(index.row())
 
             # Keep popup open if there are still results, close if empty
-            if self.results_list.model().rowCount() == 0:
+            if model.total_rows() == 0:
                 self.popup.hide()
                 self.search_box.clear()
 
@@ -719,12 +1389,14 @@ class DynamicSearchFilterWidget(QWidget):
 
     def showPopup(self, results):
         """Show popup with search results."""
-        self.results_list.model().clear()
-        for text, data in results:
-            item = QStandardItem(text)
-            item.setData(data, Qt.UserRole)
-            self.results_list.model().appendRow(item)
-        if self.results_list.model().rowCount() > 0:
+        self._ensure_popup()
+        model = self.results_list.model()
+        # The results are held as plain tuples, so a new result set is a
+        # single model reset with no per-row item allocation
+        model.set_rows(results)
+        self.results_list.scrollToTop()
+
+        if model.total_rows() > 0:
             point = self.mapToGlobal(self.search_box.geometry().bottomLeft())
             self.popup.move(point)
             self.popup.show()
@@ -732,10 +1404,8 @@ class DynamicSearchFilterWidget(QWidget):
             self.search_box.setFocus()
             # Force focus to stay on the search box by raising it
             self.search_box.raise_()
-            # Process events to ensure focus is properly set
-            from qgis.PyQt.QtWidgets import QApplication
-            QApplication.processEvents()
-            self.search_box.setFocus()  # Set focus again to be sure
+            # Set focus again once the popup's show events have been handled
+            QTimer.singleShot(0, self.search_box.setFocus)
         else:
             self.popup.hide()
 
@@ -743,81 +1413,113 @@ class DynamicSearchFilterWidget(QWidget):
         """Add an item to the selection."""
         if data not in self._selected_items:
             self._selected_items[data] = text
-            self._updateChips()
-            self.selectionChanged.emit(self.currentData())
+            self._selection_modified()
 
+    @pyqtSlot(object)
     def removeChip(self, data_to_remove):
         """Remove a chip from the selection."""
         if data_to_remove in self._selected_items:
             del self._selected_items[data_to_remove]
+            self._selection_modified()
+
+    def begin_bulk(self):
+        """Defer chip updates and selectionChanged until end_bulk()."""
+        self._bulk = True
+
+    def end_bulk(self):
+        """Apply changes made since begin_bulk() with one chip update and one selectionChanged."""
+        self._bulk = False
+        if self._bulk_dirty:
+            self._bulk_dirty = False
             self._updateChips()
             self.selectionChanged.emit(self.currentData())
 
-    def _updateChips(self):
-        """Update the chip display with 4+ item limitation."""
-        # Clear existing chips
-        while self.chip_layout.count():
-            child = self.chip_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        if not self._selected_items:
-            self.chip_container.setVisible(False)
+    def _selection_modified(self):
+        """Refresh chips and notify listeners, or defer both while in bulk mode."""
+        if self._bulk:
+            self._bulk_dirty = True
             return
+        self._updateChips()
+        self.selectionChanged.emit(self.currentData())
 
-        selected_items_list = list(self._selected_items.items())
-        total_items = len(selected_items_list)
-
-        if total_items <= 4:
-            # Show all chips if 4 or fewer
-            for data, text in selected_items_list:
-                chip = Chip(text, data)
-                chip.removed.connect(self.removeChip)
-                self.chip_layout.addWidget(chip)
-        else:
-            # Show first 4 chips + "view all" button
-            for data, text in selected_items_list[:4]:
-                chip = Chip(text, data)
-                chip.removed.connect(self.removeChip)
-                self.chip_layout.addWidget(chip)
+    def _updateChips(self):
+        """Update the chip display with 4+ item limitation.
 
-            # Add "view all" chip-like button
-            remaining_count = total_items - 4
-            view_all_chip = ViewAllChip(f"+ {remaining_count} more")
-            view_all_chip.clicked.connect(self.show_all_items_dialog)
-            self.chip_layout.addWidget(view_all_chip)
+        Existing chips are kept; only chips that appear or disappear are
+        created or deleted, and the "view all" chip is relabelled in place.
+        """
+        # Show the first 4 chips, the rest go behind the "view all" chip
+        shown_items = list(islice(self._selected_items.items(), 4))
+        remaining_count = len(self._selected_items) - 4
+        rendered = (shown_items, max(remaining_count, 0))
+        if rendered == self._rendered_chips:
+            return
+        self._rendered_chips = rendered
 
-        self.chip_container.setVisible(True)
+        # Apply the changes with repaints suspended so the container is
+        # painted once instead of once per changed chip
+        self.chip_container.setUpdatesEnabled(False)
+        try:
+            sync_chip_layout(self.chip_layout, self._chip_by_data, shown_items, self.removeChip)
+
+            if remaining_count > 0:
+                if self._view_all_chip is None:
+                    self._view_all_chip = ViewAllChip("")
+                    self._view_all_chip.clicked.connect(self.show_all_items_dialog)
+                    self.chip_layout.addWidget(self._view_all_chip)
+                self._view_all_chip.text = f"+ {remaining_count} more"
+                self._view_all_chip.label.setText(self._view_all_chip.text)
+            elif self._view_all_chip is not None:
+                self.chip_layout.removeWidget(self._view_all_chip)
+                self._view_all_chip.deleteLater()
+                self._view_all_chip = None
+        finally:
+            self.chip_container.setUpdatesEnabled(True)
+
+        self.chip_container.setVisible(bool(self._selected_items))
 
     def currentData(self):
         """Return the list of selected data values."""
         return list(self._selected_items.keys())
 
     def setCurrentData(self, data_list):
-        """Set the current selection by data values."""
-        # Filter out empty strings to avoid empty chips
-        self._selected_items = {item: item for item in data_list if item}
+        """Set the current selection by data values.
+
+        Accepts plain data values or (text, data) tuples. For plain values the
+        chip text is taken from the current selection when the value is already
+        selected, falling back to the value itself.
+        """
+        selected_items = {}
+        for entry in data_list:
+            if isinstance(entry, tuple):
+                text, data = entry
+            else:
+                data = entry
+                text = self._selected_items.get(data, data)
+            # Filter out empty values to avoid empty chips
+            if data:
+                selected_items[data] = text
+        # Re-applying the current selection (e.g. on a settings round trip) is a no-op
+        if list(selected_items.items()) == list(self._selected_items.items()):
+            return
+        self._selected_items = selected_items
         self._updateChips()
 
-    def eventFilter(self, obj, event):
-        """Event filter to redirect keyboard events from popup to search box."""
-        if obj == self.popup or obj == self.results_list:
-            if event.type() == QEvent.KeyPress:
-                # Handle Escape key to close popup
-                if event.key() == Qt.Key_Escape:
-                    self.popup.hide()
-                    self.search_box.clear()
-                    self.search_box.setFocus()
-                    return True
-
-                # Redirect key press events to the search box
-                if self.search_box.isVisible() and self.search_box.isEnabled():
-                    # Send the key event to the search box
-                    from qgis.PyQt.QtWidgets import QApplication
-                    QApplication.sendEvent(self.search_box, event)
-                    return True  # Event handled
-        return super().eventFilter(obj, event)
+    @pyqtSlot()
+    def _on_popup_escape(self):
+        """Clear the search after the popup was closed with Escape."""
+        self.search_box.clear()
+        self.search_box.setFocus()
+
+    @pyqtSlot(bool)
+    def _on_popup_visibility_changed(self, visible):
+        """Release the results after the popup has been hidden for a while."""
+        if visible:
+            self._popup_idle_timer.stop()
+        else:
+            self._popup_idle_timer.start()
 
+    @pyqtSlot()
     def show_all_items_dialog(self):
         """Show dialog with all selected items."""
         dialog = AllSelectedItemsDialog(self._selected_items, self)
@@ -833,7 +1535,7 @@ class DynamicSearchFilterWidget(QWidget):
         """Show loading indicator and start animation."""
         self.dropdown_icon.setVisible(False)
         self.loading_label.setVisible(True)
-        self.loading_frame_index = 0
+        self._loading_frames = cycle(_LOADING_FRAMES)
         self.loading_timer.start(100)  # Update every 100ms
 
     def hide_loading(self):
@@ -842,10 +1544,20 @@ class DynamicSearchFilterWidget(QWidget):
         self.loading_label.setVisible(False)
         self.dropdown_icon.setVisible(True)
 
+    @pyqtSlot()
     def _update_loading_animation(self):
         """Update the loading animation frame."""
-        self.loading_label.setText(self.loading_frames[self.loading_frame_index])
-        self.loading_frame_index = (self.loading_frame_index + 1) % len(self.loading_frames)
+        if not self.loading_label.isVisible():
+            # Nothing on screen to animate (e.g. the page is hidden); showEvent resumes it
+            self.loading_timer.stop()
+            return
+        self.loading_label.setText(next(self._loading_frames))
+
+    def showEvent(self, event):
+        """Resume a loading animation that was paused while the widget was hidden."""
+        super().showEvent(event)
+        if self.loading_label.isVisibleTo(self) and not self.loading_timer.isActive():
+            self.loading_timer.start(100)
 
     def has_unselected_text(self):
         """Check if there's text in the search box that hasn't been selected.
@@ -871,11 +1583,26 @@ class SearchableStaticFilterWidget(QWidget):
     def __init__(self, static_data=None, parent=None, show_all_chips=False, show_search_icon=True, read_only=False):
         super().__init__(parent)
         self._selected_items = {}
+        self._chip_by_data = {}  # data -> Chip currently shown
+        self._view_all_chip = None
+        self._rendered_chips = None  # (shown (data, text) pairs, hidden count) last applied by _updateChips
+        self._bulk = False  # Set between begin_bulk() and end_bulk()
+        self._bulk_dirty = False
         self._static_data = static_data or []  # List of strings or tuples (display, value)
+        self._search_keys, self._search_rows = self._build_search_index(self._static_data)
+        # Last filter query and the indices of all its matches (None if the scan was cut short)
+        self._last_query = ""
+        self._last_indices = None
         self._show_all_chips = show_all_chips  # Control whether to show all chips or limit to 4
         self._show_search_icon = show_search_icon  # Control whether to show search icon
         self._read_only = read_only  # Control whether search box is read-only (click-only selection)
 
+        # Filter once typing pauses rather than on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(STATIC_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search_filter)
+
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(4)
@@ -886,50 +1613,20 @@ class SearchableStaticFilterWidget(QWidget):
         search_layout = QHBoxLayout(search_container)
         search_layout.setContentsMargins(0, 0, 0, 0)
         search_layout.setSpacing(0)
-
-        # Detect theme for styling
-        from qgis.PyQt.QtWidgets import QApplication
-        palette = QApplication.palette()
-        window_color = palette.color(palette.Window)
-        is_dark_theme = window_color.lightness() < 128
-
-        # Theme-aware colors
-        if is_dark_theme:
-            border_color = "#555555"
-            bg_color = "#2b2b2b"
-            text_color = "#E0E0E0"
-            placeholder_color = "#888888"
-            hover_border = "#2196F3"
-            focus_border = "#1976D2"
-            icon_color = "#888888"
-        else:
-            border_color = "#C0C0C0"
-            bg_color = "#FFFFFF"
-            text_color = "#000000"
-            placeholder_color = "#999999"
-            hover_border = "#2196F3"
-            focus_border = "#1976D2"
-            icon_color = "#666666"
+        # One theme-aware stylesheet styles every part of the search bar
+        search_container.setStyleSheet(get_search_stylesheet(_SEARCH_BAR_QSS))
 
         # Search icon label (left side) - conditionally shown
         if self._show_search_icon:
             self.search_icon = QLabel("🔍", search_container)
+            self.search_icon.setObjectName("searchIcon")
             self.search_icon.setFixedWidth(28)
             self.search_icon.setAlignment(Qt.AlignCenter)
-            self.search_icon.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {bg_color};
-                    color: {icon_color};
-                    font-size: 12px;
-                    padding: 0px;
-                    border: 1px solid {border_color};
-                    border-right: none;
-                    border-top-left-radius: 4px;
-                    border-bottom-left-radius: 4px;
-                }}
-            """)
 
         self.search_box = QLineEdit(search_container)
+        self.search_box.setObjectName("searchBox")
+        # Without the icon the search box draws the rounded left edge itself
+        self.search_box.setProperty("standalone", not self._show_search_icon)
 
         # Set read-only mode if specified
         if self._read_only:
@@ -939,65 +1636,11 @@ class SearchableStaticFilterWidget(QWidget):
             self.search_box.setPlaceholderText("Click to select or type to search...")
             self.search_box.textChanged.connect(self._on_search_text_changed)
 
-        # Adjust search box borders based on whether search icon is shown
-        if self._show_search_icon:
-            search_box_style = f"""
-                QLineEdit {{
-                    padding: 6px 8px;
-                    border: 1px solid {border_color};
-                    border-left: none;
-                    border-right: none;
-                    background-color: {bg_color};
-                    color: {text_color};
-                    font-size: 13px;
-                }}
-                QLineEdit:hover {{
-                    border-color: {border_color};
-                }}
-                QLineEdit:focus {{
-                    border-color: {border_color};
-                    outline: none;
-                }}
-            """
-        else:
-            search_box_style = f"""
-                QLineEdit {{
-                    padding: 6px 8px;
-                    border: 1px solid {border_color};
-                    border-right: none;
-                    border-top-left-radius: 4px;
-                    border-bottom-left-radius: 4px;
-                    background-color: {bg_color};
-                    color: {text_color};
-                    font-size: 13px;
-                }}
-                QLineEdit:hover {{
-                    border-color: {border_color};
-                }}
-                QLineEdit:focus {{
-                    border-color: {border_color};
-                    outline: none;
-                }}
-            """
-
-        self.search_box.setStyleSheet(search_box_style)
-
         # Dropdown arrow icon label (right side)
         self.dropdown_icon = QLabel("▼", search_container)
+        self.dropdown_icon.setObjectName("searchDropdown")
         self.dropdown_icon.setFixedWidth(28)
         self.dropdown_icon.setAlignment(Qt.AlignCenter)
-        self.dropdown_icon.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {icon_color};
-                font-size: 10px;
-                padding: 0px;
-                border: 1px solid {border_color};
-                border-left: none;
-                border-top-right-radius: 4px;
-                border-bottom-right-radius: 4px;
-            }}
-        """)
 
         # Add widgets to layout based on whether search icon is shown
         if self._show_search_icon:
@@ -1013,99 +1656,116 @@ class SearchableStaticFilterWidget(QWidget):
         self.search_box.mousePressEvent = self._on_search_box_mouse_press
 
         self.chip_container = QWidget(self)
+        self.chip_container.setStyleSheet(get_chip_stylesheet())
         self.chip_layout = FlowLayout(self.chip_container, spacing=6)
         self.chip_container.setVisible(False)
         main_layout.addWidget(self.chip_container)
 
-        self.popup = QDialog(self, Qt.Popup)
+        # Results popup is built on first use (see _ensure_popup)
+        self.popup = None
+        self.results_list = None
+
+    def _ensure_popup(self):
+        """Create the results popup the first time it is needed."""
+        if self.popup is not None:
+            return
+
+        self.popup = SearchPopup(self.search_box, self)
+        self.popup.escape_pressed.connect(self._on_popup_escape)
         self.popup_layout = QVBoxLayout(self.popup)
         self.popup_layout.setContentsMargins(0, 0, 0, 0)
         self.popup_layout.setSpacing(0)
 
         self.results_list = QListView(self.popup)
-        self.results_list.setModel(QStandardItemModel(self.results_list))
+        self.results_list.setModel(SearchResultsModel(self.results_list))
         self.results_list.clicked.connect(self.onResultClicked)
         # Prevent the list from taking keyboard focus
         self.results_list.setFocusPolicy(Qt.NoFocus)
 
-        # Enhanced popup styling with theme-awareness
-        if is_dark_theme:
-            popup_bg = "#2b2b2b"
-            popup_border = "#555555"
-            item_text = "#E0E0E0"
-            item_hover_bg = "#0D47A1"
-            item_selected_bg = "#1565C0"
-        else:
-            popup_bg = "#FFFFFF"
-            popup_border = "#C0C0C0"
-            item_text = "#000000"
-            item_hover_bg = "#E3F2FD"
-            item_selected_bg = "#BBDEFB"
-
-        self.popup.setStyleSheet(f"""
-            QDialog {{
-                background-color: {popup_bg};
-                border: 1px solid {popup_border};
-                border-radius: 4px;
-            }}
-        """)
-
-        self.results_list.setStyleSheet(f"""
-            QListView {{
-                background-color: {popup_bg};
-                color: {item_text};
-                border: none;
-                outline: none;
-                padding: 4px;
-                font-size: 13px;
-            }}
-            QListView::item {{
-                padding: 8px 10px;
-                border-radius: 3px;
-                margin: 2px;
-            }}
-            QListView::item:hover {{
-                background-color: {item_hover_bg};
-            }}
-            QListView::item:selected {{
-                background-color: {item_selected_bg};
-            }}
-        """)
+        # Enhanced popup styling with theme-awareness; one stylesheet on the
+        # popup covers the results list too
+        self.popup.setStyleSheet(get_search_stylesheet(_SEARCH_POPUP_QSS))
 
         self.popup_layout.addWidget(self.results_list)
         self.popup.setMinimumWidth(300)
-        # Prevent the popup dialog from taking keyboard focus
-        self.popup.setFocusPolicy(Qt.NoFocus)
-        # Install event filter on the popup to redirect keyboard events
-        self.popup.installEventFilter(self)
-        self.results_list.installEventFilter(self)
 
     def setStaticData(self, data):
         """Set the static data for searching."""
         self._static_data = data
+        self._search_keys, self._search_rows = self._build_search_index(data)
+        self._last_query = ""
+        self._last_indices = None
 
-    def _on_search_text_changed(self, text):
-        """Handle search text changes and show filtered results."""
-        query = text.strip().lower()
-        if not query:
-            self.popup.hide()
-            return
+    @staticmethod
+    def _build_search_index(data):
+        """Lowercase the static data once for searching.
 
-        # Filter static data based on query
-        filtered_results = []
-        for item in self._static_data:
+        Display text and value are joined with a newline into a single search
+        key, so one substring test covers both (a typed query never contains
+        a newline and so cannot match across the join).
+
+        Args:
+            data: List of strings or (display, value) tuples
+
+        Returns:
+            Tuple of parallel lists (search_keys, rows) where rows holds the
+            (display, value) tuple for each key
+        """
+        keys = []
+        rows = []
+        for item in data:
             if isinstance(item, tuple):
                 display_text, value = item
-                if query in display_text.lower() or query in value.lower():
-                    filtered_results.append((display_text, value))
+                keys.append(f"{display_text}\n{value}".lower())
+                rows.append((display_text, value))
             elif isinstance(item, str):
-                if query in item.lower():
-                    filtered_results.append((item, item))
+                keys.append(item.lower())
+                rows.append((item, item))
+        return keys, rows
 
+    @pyqtSlot(str)
+    def _on_search_text_changed(self, text):
+        """Handle search text changes; filtering runs once typing pauses."""
+        if not text.strip():
+            self._search_timer.stop()
+            self._hide_popup()
+            return
+        self._search_timer.start()
+
+    @pyqtSlot()
+    def _apply_search_filter(self):
+        """Show the static data matching the current search text."""
+        query = self.search_box.text().strip().lower()
+        if not query:
+            self._hide_popup()
+            return
+
+        # Any key matching a query that contains the previous one also matched
+        # the previous query, so narrow the previous matches when they are complete
+        keys = self._search_keys
+        if self._last_indices is not None and self._last_query and self._last_query in query:
+            candidates = self._last_indices
+        else:
+            candidates = range(len(keys))
+
+        # Filter static data based on query, stopping once enough matches are found
+        indices = []
+        truncated = False
+        for i in candidates:
+            if query in keys[i]:
+                indices.append(i)
+                if len(indices) >= STATIC_SEARCH_MAX_RESULTS:
+                    truncated = True
+                    break
+        self._last_query = query
+        self._last_indices = None if truncated else indices
+
+        rows = self._search_rows
+        filtered_results = [rows[i] for i in indices]
         if filtered_results:
             self.showPopup(filtered_results)
         else:
-            self.popup.hide()
+            self._hide_popup()
 
     def _on_search_box_mouse_press(self, event):
         """Handle mouse press event on search box to show all options."""
@@ -1118,29 +1778,27 @@ class SearchableStaticFilterWidget(QWidget):
 
     def _show_all_options(self):
         """Show all available options in the popup."""
-        all_results = []
-        for item in self._static_data:
-            if isinstance(item, tuple):
-                display_text, value = item
-                # Exclude already selected items
-                if value not in self._selected_items:
-                    all_results.append((display_text, value))
-            elif isinstance(item, str):
-                # Exclude already selected items
-                if item not in self._selected_items:
-                    all_results.append((item, item))
+        # _search_rows already holds every entry as a (display, value) tuple;
+        # exclude already selected items
+        selected = self._selected_items
+        all_results = [row for row in self._search_rows if row[1] not in selected]
 
         if all_results:
             self.showPopup(all_results)
 
+    def _hide_popup(self):
+        """Hide the results popup if it has been created."""
+        if self.popup is not None:
+            self.popup.hide()
+
     def showPopup(self, results):
         """Show popup with search results."""
-        self.results_list.model().clear()
-        for text, data in results:
-            item = QStandardItem(text)
-            item.setData(data, Qt.UserRole)
-            self.results_list.model().appendRow(item)
-        if self.results_list.model().rowCount() > 0:
+        self._ensure_popup()
+        model = self.results_list.model()
+        # The model only hands rows to the view as they are scrolled into view
+        model.set_rows(results)
+
+        if model.total_rows() > 0:
             point = self.mapToGlobal(self.search_box.geometry().bottomLeft())
             self.popup.move(point)
             self.popup.show()
@@ -1148,23 +1806,22 @@ class SearchableStaticFilterWidget(QWidget):
             self.search_box.setFocus()
             # Force focus to stay on the search box by raising it
             self.search_box.raise_()
-            # Process events to ensure focus is properly set
-            from qgis.PyQt.QtWidgets import QApplication
-            QApplication.processEvents()
-            self.search_box.setFocus()  # Set focus again to be sure
+            # Set focus again once the popup's show events have been handled
+            QTimer.singleShot(0, self.search_box.setFocus)
         else:
             self.popup.hide()
 
+    @pyqtSlot('QModelIndex')
     def onResultClicked(self, index):
         """Handle result click to add selected item."""
-        item = self.results_list.model().itemFromIndex(index)
-        if item:
-            self.addItem(item.text(), item.data(Qt.UserRole))
+        model = self.results_list.model()
+        if index.isValid():
+            self.addItem(index.data(Qt.DisplayRole), index.data(Qt.UserRole))
             # Remove the selected item from the current results to avoid re-selection
-            self.results_list.model().removeRow(index.row())
+            model.removeRow(index.row())
 
             # Keep popup open if there are still results, close if empty
-            if self.results_list.model().rowCount() == 0:
+            if model.total_rows() == 0:
                 self.popup.hide()
                 self.search_box.clear()
 
@@ -1175,51 +1832,70 @@ class SearchableStaticFilterWidget(QWidget):
         """Add an item to the selection."""
         if data not in self._selected_items:
             self._selected_items[data] = text
-            self._updateChips()
-            self.selectionChanged.emit(self.currentData())
+            self._selection_modified()
 
+    @pyqtSlot(object)
     def removeChip(self, data_to_remove):
         """Remove a chip from the selection."""
         if data_to_remove in self._selected_items:
             del self._selected_items[data_to_remove]
+            self._selection_modified()
+
+    def begin_bulk(self):
+        """Defer chip updates and selectionChanged until end_bulk()."""
+        self._bulk = True
+
+    def end_bulk(self):
+        """Apply changes made since begin_bulk() with one chip update and one selectionChanged."""
+        self._bulk = False
+        if self._bulk_dirty:
+            self._bulk_dirty = False
             self._updateChips()
             self.selectionChanged.emit(self.currentData())
 
-    def _updateChips(self):
-        """Update the chip display with 4+ item limitation."""
-        # Clear existing chips
-        while self.chip_layout.count():
-            child = self.chip_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        if not self._selected_items:
-            self.chip_container.setVisible(False)
+    def _selection_modified(self):
+        """Refresh chips and notify listeners, or defer both while in bulk mode."""
+        if self._bulk:
+            self._bulk_dirty = True
             return
+        self._updateChips()
+        self.selectionChanged.emit(self.currentData())
 
-        selected_items_list = list(self._selected_items.items())
-        total_items = len(selected_items_list)
-
-        if total_items <= 4:
-            # Show all chips if 4 or fewer
-            for data, text in selected_items_list:
-                chip = Chip(text, data)
-                chip.removed.connect(self.removeChip)
-                self.chip_layout.addWidget(chip)
-        else:
-            # Show first 4 chips + "view all" button
-            for data, text in selected_items_list[:4]:
-                chip = Chip(text, data)
-                chip.removed.connect(self.removeChip)
-                self.chip_layout.addWidget(chip)
+    def _updateChips(self):
+        """Update the chip display with 4+ item limitation.
 
-            # Add "view all" chip-like button
-            remaining_count = total_items - 4
-            view_all_chip = ViewAllChip(f"+ {remaining_count} more")
-            view_all_chip.clicked.connect(self.show_all_items_dialog)
-            self.chip_layout.addWidget(view_all_chip)
+        Existing chips are kept; only chips that appear or disappear are
+        created or deleted, and the "view all" chip is relabelled in place.
+        """
+        # Show the first 4 chips, the rest go behind the "view all" chip
+        shown_items = list(islice(self._selected_items.items(), 4))
+        remaining_count = len(self._selected_items) - 4
+        rendered = (shown_items, max(remaining_count, 0))
+        if rendered == self._rendered_chips:
+            return
+        self._rendered_chips = rendered
 
-        self.chip_container.setVisible(True)
+        # Apply the changes with repaints suspended so the container is
+        # painted once instead of once per changed chip
+        self.chip_container.setUpdatesEnabled(False)
+        try:
+            sync_chip_layout(self.chip_layout, self._chip_by_data, shown_items, self.removeChip)
+
+            if remaining_count > 0:
+                if self._view_all_chip is None:
+                    self._view_all_chip = ViewAllChip("")
+                    self._view_all_chip.clicked.connect(self.show_all_items_dialog)
+                    self.chip_layout.addWidget(self._view_all_chip)
+                self._view_all_chip.text = f"+ {remaining_count} more"
+                self._view_all_chip.label.setText(self._view_all_chip.text)
+            elif self._view_all_chip is not None:
+                self.chip_layout.removeWidget(self._view_all_chip)
+                self._view_all_chip.deleteLater()
+                self._view_all_chip = None
+        finally:
+            self.chip_container.setUpdatesEnabled(True)
+
+        self.chip_container.setVisible(bool(self._selected_items))
 
     def currentData(self):
         """Return the list of selected data values."""
@@ -1236,25 +1912,13 @@ class SearchableStaticFilterWidget(QWidget):
         self._show_all_chips = show_all
         self._updateChips()  # Refresh display
 
-    def eventFilter(self, obj, event):
-        """Event filter to redirect keyboard events from popup to search box."""
-        if obj == self.popup or obj == self.results_list:
-            if event.type() == QEvent.KeyPress:
-                # Handle Escape key to close popup
-                if event.key() == Qt.Key_Escape:
-                    self.popup.hide()
-                    self.search_box.clear()
-                    self.search_box.setFocus()
-                    return True
-
-                # Redirect key press events to the search box
-                if self.search_box.isVisible() and self.search_box.isEnabled():
-                    # Send the key event to the search box
-                    from qgis.PyQt.QtWidgets import QApplication
-                    QApplication.sendEvent(self.search_box, event)
-                    return True  # Event handled
-        return super().eventFilter(obj, event)
+    @pyqtSlot()
+    def _on_popup_escape(self):
+        """Clear the search after the popup was closed with Escape."""
+        self.search_box.clear()
+        self.search_box.setFocus()
 
+    @pyqtSlot()
     def show_all_items_dialog(self):
         """Show dialog with all selected items."""
         dialog = AllSelectedItemsDialog(self._selected_items, self)
@@ -1295,14 +1959,34 @@ class StaticFilterWidget(QWidget):
 
         self.combo_box = CheckableComboBox(self)
         self.chip_container = QWidget(self)
+        self.chip_container.setStyleSheet(get_chip_stylesheet())
         self.chip_layout = FlowLayout(self.chip_container, spacing=4)
         self.chip_container.setVisible(False)
+        self._chip_by_data = {}  # data -> Chip currently shown
 
         main_layout.addWidget(self.combo_box)
         main_layout.addWidget(self.chip_container)
 
-        self.combo_box.selectionChanged.connect(self.updateChips)
-        self.combo_box.selectionChanged.connect(self.selectionChanged.emit)
+        # Bursts of toggles rebuild the chips once; listeners are notified right away
+        self._pending_selection = []
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(CHIP_UPDATE_THROTTLE_MS)
+        self._selection_timer.timeout.connect(self._apply_pending_selection)
+
+        self.combo_box.selectionChanged.connect(self._on_combo_selection_changed)
+
+    @pyqtSlot(list)
+    def _on_combo_selection_changed(self, selected_data_list):
+        """Forward the selection and update the chips once toggling pauses."""
+        self._pending_selection = selected_data_list
+        self._selection_timer.start()
+        self.selectionChanged.emit(selected_data_list)
+
+    @pyqtSlot()
+    def _apply_pending_selection(self):
+        """Update the chips for the latest selection."""
+        self.updateChips(self._pending_selection)
 
     def addItems(self, items):
         """Add items to the combo box."""
@@ -1320,36 +2004,33 @@ class StaticFilterWidget(QWidget):
     def setCurrentData(self, data_list):
         """Set the current selection."""
         self.combo_box.setCurrentData(data_list)
+        # The chips are updated right away, so drop the deferred rebuild
+        self._selection_timer.stop()
         self.updateChips(data_list)
 
+    @pyqtSlot(list)
     def updateChips(self, selected_data_list):
-        """Update the chip display based on selection."""
-        while self.chip_layout.count():
-            child = self.chip_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        if not selected_data_list:
-            self.chip_container.setVisible(False)
-            return
-        model = self.combo_box.model()
+        """Update the chip display based on selection, only touching chips that changed."""
+        items = []
         for data in selected_data_list:
-            display_text = ""
-            for i in range(model.rowCount()):
-                if model.item(i).data(Qt.UserRole) == data:
-                    display_text = model.item(i).text()
-                    break
+            display_text = self.combo_box.textForData(data)
             if display_text:
-                chip = Chip(display_text, data)
-                chip.removed.connect(self.removeChip)
-                self.chip_layout.addWidget(chip)
-        self.chip_container.setVisible(True)
+                items.append((data, display_text))
+
+        # Apply the changes with repaints suspended so the container is
+        # painted once instead of once per changed chip
+        self.chip_container.setUpdatesEnabled(False)
+        try:
+            sync_chip_layout(self.chip_layout, self._chip_by_data, items, self.removeChip)
+        finally:
+            self.chip_container.setUpdatesEnabled(True)
+        self.chip_container.setVisible(bool(selected_data_list))
 
+    @pyqtSlot(object)
     def removeChip(self, data_to_remove):
         """Remove a chip and update selection."""
-        current_selection = self.currentData()
-        if data_to_remove in current_selection:
-            current_selection.remove(data_to_remove)
-            self.setCurrentData(current_selection)
+        if self.combo_box.isDataSelected(data_to_remove):
+            self.setCurrentData([data for data in self.currentData() if data != data_to_remove])
 
 class LoginDialog(QDialog):
     """Dialog for user authentication."""
@@ -1420,6 +2101,7 @@ class LoginDialog(QDialog):
         else:
             self.email_input.setFocus()
 
+    @pyqtSlot()
     def handle_login_attempt(self):
         """Handle login button click."""
         self.error_label.setVisible(False)
@@ -1441,6 +2123,122 @@ class LoginDialog(QDialog):
         """Get entered credentials."""
         return self.email_input.text().strip(), self.password_input.text()
 
+
+# Point colour button style; %s is the colour name
+_POINT_COLOR_BUTTON_QSS_TMPL = """
+    QPushButton {
+        background-color: %s;
+        border: 1px solid #333;
+        padding: 8px;
+        font-weight: bold;
+        border-radius: 0px;
+    }
+    QPushButton:hover {
+        cursor:pointer
+    }
+"""
+
+
+# Trace range combo box styles, keyed by is_dark_theme like _BUTTON_QSS
+_COMBOBOX_QSS_DARK = """
+    QComboBox {
+        color: #FFFFFF;
+        background-color: #3C3C3C;
+        border: 1px solid #555555;
+        padding: 3px 25px 3px 3px;
+    }
+    QComboBox:hover {
+        border: 1px solid #777777;
+    }
+    QComboBox:disabled {
+        color: #808080;
+        background-color: #2A2A2A;
+        border: 1px solid #444444;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: 1px solid #555555;
+        background-color: #4A4A4A;
+    }
+    QComboBox::drop-down:hover {
+        background-color: #555555;
+    }
+    QComboBox::drop-down:disabled {
+        background-color: #2A2A2A;
+        border-left: 1px solid #444444;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 6px solid #FFFFFF;
+        width: 0px;
+        height: 0px;
+    }
+    QComboBox::down-arrow:disabled {
+        border-top: 6px solid #555555;
+    }
+    QComboBox QAbstractItemView {
+        color: #FFFFFF;
+        background-color: #3C3C3C;
+        selection-background-color: #4A4A4A;
+        selection-color: #FFFFFF;
+    }
+"""
+
+_COMBOBOX_QSS_LIGHT = """
+    QComboBox {
+        color: #000000;
+        background-color: #FFFFFF;
+        border: 1px solid #CCCCCC;
+        padding: 3px 25px 3px 3px;
+    }
+    QComboBox:hover {
+        border: 1px solid #999999;
+    }
+    QComboBox:disabled {
+        color: #999999;
+        background-color: #F5F5F5;
+        border: 1px solid #E0E0E0;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: 1px solid #CCCCCC;
+        background-color: #F0F0F0;
+    }
+    QComboBox::drop-down:hover {
+        background-color: #E0E0E0;
+    }
+    QComboBox::drop-down:disabled {
+        background-color: #F5F5F5;
+        border-left: 1px solid #E0E0E0;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 6px solid #000000;
+        width: 0px;
+        height: 0px;
+    }
+    QComboBox::down-arrow:disabled {
+        border-top: 6px solid #BBBBBB;
+    }
+    QComboBox QAbstractItemView {
+        color: #000000;
+        background-color: #FFFFFF;
+        selection-background-color: #E3F2FD;
+        selection-color: #000000;
+    }
+"""
+
+_COMBOBOX_QSS = {True: _COMBOBOX_QSS_DARK, False: _COMBOBOX_QSS_LIGHT}
+
+
 class LayerOptionsDialog(QDialog):
     """Dialog for configuring layer import options."""
 
@@ -1457,19 +2255,16 @@ class LayerOptionsDialog(QDialog):
         self.setWindowTitle("Layer Import Options")
         self.setModal(True)
         self.is_assay_data = is_assay_data
+        # Trace config for assay data is loaded with the trace section on first show
         self.trace_range_config = None
-
-        # Initialize trace config for assay data
-        if self.is_assay_data:
-            from ..config.trace_ranges import get_industry_standard_preset
-            self.trace_range_config = get_industry_standard_preset()
+        self._trace_ui_built = False
+        # Preset the range widgets currently reflect; "Custom" once the user edits them
+        self._current_preset_name = None
 
         self._setup_ui(default_name)
 
     def _setup_ui(self, default_name):
         """Setup the dialog UI."""
-        from ..config.trace_ranges import get_available_presets
-
         layout = QVBoxLayout(self)
         self.setMinimumWidth(600)
 
@@ -1522,7 +2317,8 @@ class LayerOptionsDialog(QDialog):
         self.color_button.setFixedWidth(48)
         self.color_button.setAutoDefault(False)
         # ... connect and style button (ensure the rounded style is applied)
-        self.selected_color = QColor(255, 0, 0)
+        self.selected_color = QColor(_DEFAULT_POINT_COLOR)  # Copy so each dialog can change its own
+        self._color_button_color_name = None  # Colour the button stylesheet was last built for
         self.update_color_button_stylesheet() # Make sure this applies the rounded style
         self.color_button.clicked.connect(self.select_color)
 
@@ -1538,88 +2334,10 @@ class LayerOptionsDialog(QDialog):
 
         layout.addLayout(form_layout)
 
-        # Trace range configuration section (only for assay data)
-        if self.is_assay_data:
-            # Separator
-            separator = QFrame()
-            separator.setFrameShape(QFrame.HLine)
-            separator.setFrameShadow(QFrame.Sunken)
-            layout.addWidget(separator)
-
-            # Trace range section
-            trace_group_label = QLabel("Trace Range Configuration")
-            trace_font = QFont()
-            trace_font.setBold(True)
-            trace_group_label.setFont(trace_font)
-            layout.addWidget(trace_group_label)
-
-            # Preset selector
-            preset_layout = QHBoxLayout()
-            preset_label = QLabel("Preset:")
-            preset_layout.addWidget(preset_label)
-
-            self.trace_preset_combo = QComboBox()
-            for preset_name in get_available_presets():
-                display_name = f"{preset_name}"
-                self.trace_preset_combo.addItem(display_name, preset_name)  # Store original name as data
-            self.trace_preset_combo.addItem("Custom")  # Add Custom option
-            self.trace_preset_combo.setCurrentText("Default")
-            self.trace_preset_combo.currentTextChanged.connect(self._on_preset_changed)
-            self.trace_preset_combo.setFocusPolicy(Qt.ClickFocus)  # Prevent wheel scrolling when not focused
-            preset_layout.addWidget(self.trace_preset_combo, stretch=1)
-            preset_layout.addStretch()
-
-            layout.addLayout(preset_layout)
-
-            # Trace scale visibility configuration
-            scale_layout = QHBoxLayout()
-            scale_label = QLabel("Trace Visibility Scale:")
-            scale_label.setToolTip("Map scale at which trace lines become visible.\nLower values = need to zoom in more to see traces.\nDefault: 1:50,000")
-            scale_layout.addWidget(scale_label)
-
-            self.trace_scale_spin = QDoubleSpinBox()
-            self.trace_scale_spin.setRange(1000, 500000)  # Reasonable range for map scales
-            self.trace_scale_spin.setDecimals(0)
-            self.trace_scale_spin.setValue(TRACE_SCALE_THRESHOLD)  # Default from constants
-            self.trace_scale_spin.setSuffix("")
-            self.trace_scale_spin.setPrefix("1:")
-            self.trace_scale_spin.setSingleStep(10000)
-            self.trace_scale_spin.setToolTip("Traces visible when zoomed in closer than this scale.\nExample: 1:50,000 means traces show at scales like 1:25,000, 1:10,000, etc.")
-            self.trace_scale_spin.setFocusPolicy(Qt.StrongFocus)
-            scale_layout.addWidget(self.trace_scale_spin)
-            scale_layout.addStretch()
-
-            layout.addLayout(scale_layout)
-
-            # Scroll area for range widgets
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setMinimumHeight(250)
-            scroll_area.setMaximumHeight(400)
-            scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-            self.ranges_container = QWidget()
-            self.ranges_layout = QVBoxLayout(self.ranges_container)
-            self.ranges_layout.setContentsMargins(0, 0, 0, 0)
-            self.ranges_layout.setSpacing(0)
-
-            scroll_area.setWidget(self.ranges_container)
-            layout.addWidget(scroll_area)
-
-            # Add/Remove buttons (only visible when Custom selected)
-            button_layout = QHBoxLayout()
-            self.add_range_button = QPushButton("+ Add Range")
-            self.add_range_button.clicked.connect(self._add_range)
-            self.add_range_button.setVisible(False)  # Hidden by default
-            button_layout.addWidget(self.add_range_button)
-            button_layout.addStretch()
-            layout.addLayout(button_layout)
-
-            # Initialize range widgets list
-            self.range_widgets = []
-
-            # Populate initial ranges
-            self._populate_ranges()
+        # Trace range configuration section (only for assay data), filled in
+        # by _setup_trace_ui() when the dialog is first shown
+        self.trace_section_layout = QVBoxLayout()
+        layout.addLayout(self.trace_section_layout)
 
         # Buttons
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -1633,23 +2351,134 @@ class LayerOptionsDialog(QDialog):
 
         layout.addWidget(self.button_box)
 
+    def setVisible(self, visible):
+        """Build the trace range section just before the dialog is first shown."""
+        if visible and self.is_assay_data and not self._trace_ui_built:
+            self._setup_trace_ui()
+        super().setVisible(visible)
+
+    def _setup_trace_ui(self):
+        """Setup the trace range configuration section (assay data only)."""
+        self._trace_ui_built = True
+        self.trace_range_config = get_industry_standard_preset()
+        self._current_preset_name = "Default"
+        layout = self.trace_section_layout
+
+        # Separator
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        separator.setFrameShadow(QFrame.Sunken)
+        layout.addWidget(separator)
+
+        # Trace range section
+        trace_group_label = QLabel("Trace Range Configuration")
+        trace_group_label.setFont(get_bold_font())
+        layout.addWidget(trace_group_label)
+
+        # Preset selector
+        preset_layout = QHBoxLayout()
+        preset_label = QLabel("Preset:")
+        preset_layout.addWidget(preset_label)
+
+        self.trace_preset_combo = QComboBox()
+        for preset_name in get_available_presets():
+            display_name = f"{preset_name}"
+            self.trace_preset_combo.addItem(display_name, preset_name)  # Store original name as data
+        self.trace_preset_combo.addItem("Custom")  # Add Custom option
+        self.trace_preset_combo.setCurrentText("Default")
+        self.trace_preset_combo.currentTextChanged.connect(self._on_preset_changed)
+        self.trace_preset_combo.setFocusPolicy(Qt.ClickFocus)  # Prevent wheel scrolling when not focused
+        preset_layout.addWidget(self.trace_preset_combo, stretch=1)
+        preset_layout.addStretch()
+
+        layout.addLayout(preset_layout)
+
+        # Trace scale visibility configuration
+        scale_layout = QHBoxLayout()
+        scale_label = QLabel("Trace Visibility Scale:")
+        scale_label.setToolTip("Map scale at which trace lines become visible.\nLower values = need to zoom in more to see traces.\nDefault: 1:50,000")
+        scale_layout.addWidget(scale_label)
+
+        self.trace_scale_spin = QDoubleSpinBox()
+        self.trace_scale_spin.setRange(1000, 500000)  # Reasonable range for map scales
+        self.trace_scale_spin.setDecimals(0)
+        self.trace_scale_spin.setValue(TRACE_SCALE_THRESHOLD)  # Default from constants
+        self.trace_scale_spin.setSuffix("")
+        self.trace_scale_spin.setPrefix("1:")
+        self.trace_scale_spin.setSingleStep(10000)
+        self.trace_scale_spin.setToolTip("Traces visible when zoomed in closer than this scale.\nExample: 1:50,000 means traces show at scales like 1:25,000, 1:10,000, etc.")
+        self.trace_scale_spin.setFocusPolicy(Qt.StrongFocus)
+        scale_layout.addWidget(self.trace_scale_spin)
+        scale_layout.addStretch()
+
+        layout.addLayout(scale_layout)
+
+        # Scroll area for range widgets
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setMinimumHeight(250)
+        scroll_area.setMaximumHeight(400)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.ranges_container = QWidget()
+        self.ranges_layout = QVBoxLayout(self.ranges_container)
+        self.ranges_layout.setContentsMargins(0, 0, 0, 0)
+        self.ranges_layout.setSpacing(0)
+        # Range widgets are inserted before this stretch
+        self.ranges_layout.addStretch()
+
+        scroll_area.setWidget(self.ranges_container)
+        layout.addWidget(scroll_area)
+
+        # Add/Remove buttons (only visible when Custom selected)
+        button_layout = QHBoxLayout()
+        self.add_range_button = QPushButton("+ Add Range")
+        self.add_range_button.clicked.connect(self._add_range)
+        self.add_range_button.setVisible(False)  # Hidden by default
+        button_layout.addWidget(self.add_range_button)
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+
+        # Range widgets in display order, as dict keys for O(1) removal
+        self.range_widgets = {}
+        # Widgets dropped by a smaller preset, kept for reuse by _add_range_widget
+        self._spare_range_widgets = []
+
+        # Populate initial ranges
+        self._populate_ranges()
+
         # Apply theme-aware styling to combo boxes
-        if self.is_assay_data:
-            self._apply_combobox_styling()
+        self._apply_combobox_styling()
 
     def _populate_ranges(self):
-        """Populate range widgets from current configuration."""
-        # Clear existing widgets
-        for widget in self.range_widgets:
-            widget.deleteLater()
-        self.range_widgets.clear()
+        """Populate range widgets from current configuration.
 
-        # Add widget for each range
-        for trace_range in self.trace_range_config.ranges:
-            self._add_range_widget(trace_range)
+        Existing widgets are rebound to the new ranges in place (those that
+        already match are left alone); extra ranges reuse spare widgets
+        before new ones are created, and leftover widgets become spares.
+        """
+        old_widgets = list(self.range_widgets)
+        self.range_widgets = {}
 
-        # Add stretch at the end
-        self.ranges_layout.addStretch()
+        # Rebind the widgets with repaints suspended so the container is
+        # painted once with the final set of ranges
+        self.ranges_container.setUpdatesEnabled(False)
+        try:
+            for index, trace_range in enumerate(self.trace_range_config.ranges):
+                if index < len(old_widgets):
+                    widget = old_widgets[index]
+                    if widget.get_trace_range().to_dict() != trace_range.to_dict():
+                        widget.set_trace_range(trace_range)
+                    self.range_widgets[widget] = None
+                else:
+                    self._add_range_widget(trace_range)
+
+            for widget in old_widgets[len(self.range_widgets):]:
+                self.ranges_layout.removeWidget(widget)
+                widget.hide()
+                self._spare_range_widgets.append(widget)
+        finally:
+            self.ranges_container.setUpdatesEnabled(True)
 
         # Update editability based on preset
         is_custom = self.trace_preset_combo.currentText() == "Custom"
@@ -1659,20 +2488,23 @@ class LayerOptionsDialog(QDialog):
         self._apply_combobox_styling()
 
     def _add_range_widget(self, trace_range):
-        """Add a range widget to the layout."""
-        widget = TraceRangeWidget(trace_range)
-        widget.removed.connect(self._remove_range_widget)
-        widget.changed.connect(self._mark_as_custom)
-        self.range_widgets.append(widget)
+        """Add a range widget to the layout, reusing a spare one if there is one."""
+        if self._spare_range_widgets:
+            widget = self._spare_range_widgets.pop()
+            widget.set_trace_range(trace_range)
+        else:
+            widget = TraceRangeWidget(trace_range)
+            widget.removed.connect(self._remove_range_widget)
+            widget.changed.connect(self._mark_as_custom)
+        self.range_widgets[widget] = None
 
         # Insert before the stretch
         self.ranges_layout.insertWidget(len(self.range_widgets) - 1, widget)
+        widget.show()
 
+    @pyqtSlot()
     def _add_range(self):
         """Add a new empty range."""
-        from ..config.trace_ranges import TraceRange, BoundaryFormula, RangeType
-        from qgis.PyQt.QtGui import QColor
-
         # Create a default range
         new_range = TraceRange(
             "New Range",
@@ -1682,10 +2514,9 @@ class LayerOptionsDialog(QDialog):
         )
         self._add_range_widget(new_range)
 
+    @pyqtSlot(object)
     def _remove_range_widget(self, widget):
         """Remove a range widget."""
-        from ..config.constants import MIN_TRACE_RANGES
-
         if len(self.range_widgets) <= MIN_TRACE_RANGES:
             QMessageBox.warning(
                 self,
@@ -1695,11 +2526,13 @@ class LayerOptionsDialog(QDialog):
             return
 
         if widget in self.range_widgets:
-            self.range_widgets.remove(widget)
+            del self.range_widgets[widget]
             widget.deleteLater()
 
+    @pyqtSlot()
     def _mark_as_custom(self):
         """Mark configuration as custom when user edits."""
+        self._current_preset_name = "Custom"
         if self.trace_preset_combo.currentText() != "Custom":
             self.trace_preset_combo.blockSignals(True)
             self.trace_preset_combo.setCurrentText("Custom")
@@ -1717,107 +2550,7 @@ class LayerOptionsDialog(QDialog):
     def _apply_combobox_styling(self):
         """Apply theme-aware styling to all combo boxes in the dialog."""
         try:
-            from PyQt5.QtWidgets import QApplication
-            palette = QApplication.palette()
-            window_color = palette.color(palette.Window)
-            is_dark_theme = window_color.lightness() < 128
-
-            if is_dark_theme:
-                combobox_style = """
-                    QComboBox {
-                        color: #FFFFFF;
-                        background-color: #3C3C3C;
-                        border: 1px solid #555555;
-                        padding: 3px 25px 3px 3px;
-                    }
-                    QComboBox:hover {
-                        border: 1px solid #777777;
-                    }
-                    QComboBox:disabled {
-                        color: #808080;
-                        background-color: #2A2A2A;
-                        border: 1px solid #444444;
-                    }
-                    QComboBox::drop-down {
-                        subcontrol-origin: padding;
-                        subcontrol-position: top right;
-                        width: 20px;
-                        border-left: 1px solid #555555;
-                        background-color: #4A4A4A;
-                    }
-                    QComboBox::drop-down:hover {
-                        background-color: #555555;
-                    }
-                    QComboBox::drop-down:disabled {
-                        background-color: #2A2A2A;
-                        border-left: 1px solid #444444;
-                    }
-                    QComboBox::down-arrow {
-                        image: none;
-                        border-left: 4px solid transparent;
-                        border-right: 4px solid transparent;
-                        border-top: 6px solid #FFFFFF;
-                        width: 0px;
-                        height: 0px;
-                    }
-                    QComboBox::down-arrow:disabled {
-                        border-top: 6px solid #555555;
-                    }
-                    QComboBox QAbstractItemView {
-                        color: #FFFFFF;
-                        background-color: #3C3C3C;
-                        selection-background-color: #4A4A4A;
-                        selection-color: #FFFFFF;
-                    }
-                """
-            else:
-                combobox_style = """
-                    QComboBox {
-                        color: #000000;
-                        background-color: #FFFFFF;
-                        border: 1px solid #CCCCCC;
-                        padding: 3px 25px 3px 3px;
-                    }
-                    QComboBox:hover {
-                        border: 1px solid #999999;
-                    }
-                    QComboBox:disabled {
-                        color: #999999;
-                        background-color: #F5F5F5;
-                        border: 1px solid #E0E0E0;
-                    }
-                    QComboBox::drop-down {
-                        subcontrol-origin: padding;
-                        subcontrol-position: top right;
-                        width: 20px;
-                        border-left: 1px solid #CCCCCC;
-                        background-color: #F0F0F0;
-                    }
-                    QComboBox::drop-down:hover {
-                        background-color: #E0E0E0;
-                    }
-                    QComboBox::drop-down:disabled {
-                        background-color: #F5F5F5;
-                        border-left: 1px solid #E0E0E0;
-                    }
-                    QComboBox::down-arrow {
-                        image: none;
-                        border-left: 4px solid transparent;
-                        border-right: 4px solid transparent;
-                        border-top: 6px solid #000000;
-                        width: 0px;
-                        height: 0px;
-                    }
-                    QComboBox::down-arrow:disabled {
-                        border-top: 6px solid #BBBBBB;
-                    }
-                    QComboBox QAbstractItemView {
-                        color: #000000;
-                        background-color: #FFFFFF;
-                        selection-background-color: #E3F2FD;
-                        selection-color: #000000;
-                    }
-                """
+            combobox_style = _COMBOBOX_QSS[_is_dark_theme()]
 
             # Apply to trace preset combo
             self.trace_preset_combo.setStyleSheet(combobox_style)
@@ -1833,9 +2566,12 @@ class LayerOptionsDialog(QDialog):
             # Fail silently - styling is optional
             pass
 
+    @pyqtSlot(str)
     def _on_preset_changed(self, preset_name):
         """Handle preset selection change."""
-        from ..config.trace_ranges import get_preset_by_name, get_industry_standard_preset, TraceRange
+        if preset_name == self._current_preset_name:
+            return
+        self._current_preset_name = preset_name
 
         if preset_name == "Custom":
             # Load Default as template with generic "Range N" names
@@ -1851,7 +2587,6 @@ class LayerOptionsDialog(QDialog):
                 custom_ranges.append(custom_range)
 
             # Update config with custom ranges
-            from ..config.trace_ranges import TraceRangeConfiguration
             self.trace_range_config = TraceRangeConfiguration(custom_ranges, "Custom")
             self._populate_ranges()
         else:
@@ -1861,6 +2596,7 @@ class LayerOptionsDialog(QDialog):
             self.trace_range_config = get_preset_by_name(actual_preset_name)
             self._populate_ranges()
 
+    @pyqtSlot()
     def _on_accept(self):
         """Validate and accept the configuration."""
         if self.is_assay_data:
@@ -1887,7 +2623,6 @@ class LayerOptionsDialog(QDialog):
                 return
 
             # Update configuration
-            from ..config.trace_ranges import TraceRangeConfiguration
             self.trace_range_config = TraceRangeConfiguration(
                 ranges,
                 self.trace_preset_combo.currentText()
@@ -1910,8 +2645,6 @@ class LayerOptionsDialog(QDialog):
         Returns:
             Dictionary with 'valid' (bool) and 'message' (str) keys
         """
-        from ..config.trace_ranges import RangeType
-
         # Check for empty names
         for i, r in enumerate(ranges):
             if not r.name or r.name.strip() == "" or r.name == "Unnamed Range":
@@ -1942,6 +2675,7 @@ class LayerOptionsDialog(QDialog):
 
         return {'valid': True, 'message': ''}
 
+    @pyqtSlot()
     def select_color(self):
         """Open color picker dialog."""
         color = QColorDialog.getColor(self.selected_color, self, "Choose Point Color")
@@ -1950,19 +2684,11 @@ class LayerOptionsDialog(QDialog):
             self.update_color_button_stylesheet()
 
     def update_color_button_stylesheet(self):
-        """Update the color button appearance."""
-        self.color_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.selected_color.name()};
-                border: 1px solid #333;
-                padding: 8px;
-                font-weight: bold;
-                border-radius: 0px; 
-            }}
-            QPushButton:hover {{
-                cursor:pointer
-            }}
-        """)
+        """Update the color button appearance if the colour changed."""
+        color_name = self.selected_color.name()
+        if color_name != self._color_button_color_name:
+            self._color_button_color_name = color_name
+            self.color_button.setStyleSheet(_POINT_COLOR_BUTTON_QSS_TMPL % color_name)
 
     def get_options(self):
         """Get the configured options.
@@ -1988,6 +2714,20 @@ class LayerOptionsDialog(QDialog):
                 self.selected_color
             )
 
+_WARN_MSG_TMPL = """
+You are about to import {count:,} records to QGIS.
+
+Performance Impact:
+• QGIS may become unresponsive during import.
+• Large datasets can cause memory issues.
+• Consider importing a subset for testing first.
+        """
+_WARN_MSG_QSS = "padding: 12px; background-color: #f5f5f5; border: 1px solid #ddd; border-radius: 4px; color: #333;"
+_BTN_QSS_NORMAL = "padding: 8px; font-weight: bold;"
+_BTN_QSS_DANGER = "padding: 8px; font-weight: bold; background-color: #ffebee; color: #c62828;"
+_BTN_QSS_SAFE = "padding: 8px; background-color: #e8f5e8; color: #2e7d32;"
+
+
 class LargeImportWarningDialog(QDialog):
     """Dialog to warn users about large dataset imports."""
     
@@ -2017,10 +2757,7 @@ class LargeImportWarningDialog(QDialog):
         warning_label = QLabel("⚠️")
         warning_label.setStyleSheet("font-size: 24px;")
         title_label = QLabel("Large Dataset Import")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(get_bold_font(14))
         
         title_layout.addWidget(warning_label)
         title_layout.addWidget(title_label)
@@ -2028,18 +2765,9 @@ class LargeImportWarningDialog(QDialog):
         layout.addLayout(title_layout)
         
         # Warning message
-        message_text = f"""
-You are about to import {record_count:,} records to QGIS.
-
-Performance Impact:
-• QGIS may become unresponsive during import.
-• Large datasets can cause memory issues.
-• Consider importing a subset for testing first.
-        """
-        
-        message_label = QLabel(message_text)
+        message_label = QLabel(_WARN_MSG_TMPL.format(count=record_count))
         message_label.setWordWrap(True)
-        message_label.setStyleSheet("padding: 12px; background-color: #f5f5f5; border: 1px solid #ddd; border-radius: 4px; color: #333;")
+        message_label.setStyleSheet(_WARN_MSG_QSS)
         layout.addWidget(message_label)
         
         # Options
@@ -2050,16 +2778,17 @@ Performance Impact:
         button_layout = QVBoxLayout()
         
         # Import all button
-        self.import_all_btn = QPushButton(f"Import All {record_count:,} Records")
-        self.import_all_btn.setStyleSheet("padding: 8px; font-weight: bold;")
-        if record_count > self.max_safe_import:
-            self.import_all_btn.setStyleSheet("padding: 8px; font-weight: bold; background-color: #ffebee; color: #c62828;")
-            self.import_all_btn.setText(f"⚠️ Import All {record_count:,} Records (Not Recommended)")
+        is_unsafe = record_count > self.max_safe_import
+        if is_unsafe:
+            self.import_all_btn = QPushButton(f"⚠️ Import All {record_count:,} Records (Not Recommended)")
+        else:
+            self.import_all_btn = QPushButton(f"Import All {record_count:,} Records")
+        self.import_all_btn.setStyleSheet(_BTN_QSS_DANGER if is_unsafe else _BTN_QSS_NORMAL)
 
         # Import partial button
         partial_count = min(self.partial_limit, record_count)
         self.import_partial_btn = QPushButton(f"Import First {partial_count:,} Records")
-        self.import_partial_btn.setStyleSheet("padding: 8px; background-color: #e8f5e8; color: #2e7d32;")
+        self.import_partial_btn.setStyleSheet(_BTN_QSS_SAFE)
         
         # Cancel button
         self.cancel_btn = QPushButton("Cancel Import")
@@ -2080,21 +2809,24 @@ Performance Impact:
         self.cancel_btn.clicked.connect(self._cancel)
         
         # Set default focus
-        if record_count > self.max_safe_import:
+        if is_unsafe:
             self.import_partial_btn.setDefault(True)
         else:
             self.import_all_btn.setDefault(True)
     
+    @pyqtSlot()
     def _import_all(self):
         """User chose to import all records."""
         self.user_choice = self.IMPORT_ALL
         self.accept()
     
+    @pyqtSlot()
     def _import_partial(self):
         """User chose to import partial records."""
         self.user_choice = self.IMPORT_PARTIAL
         self.accept()
     
+    @pyqtSlot()
     def _cancel(self):
         """User chose to cancel import."""
         self.user_choice = self.CANCEL
@@ -2106,6 +2838,10 @@ Performance Impact:
 
 class ImportProgressDialog(QProgressDialog):
     """Progress dialog for chunked imports with cancellation."""
+
+    # Label templates: (percentage, processed, total) and (percentage, chunk_info, processed, total)
+    LABEL_TEMPLATE = "Importing records... (%d%%)\nProcessed: %s of %s"
+    LABEL_TEMPLATE_WITH_INFO = "Importing records... (%d%%)\n%s\nProcessed: %s of %s"
     
     def __init__(self, total_records: int, parent=None):
         super().__init__(parent)
@@ -2115,54 +2851,126 @@ class ImportProgressDialog(QProgressDialog):
         
         self.total_records = total_records
         self.processed_records = 0
+        # Formatted once; only the processed count changes between updates
+        self._total_str = f"{total_records:,}"
         
-        # Set up progress dialog
+        # Set up progress dialog. QProgressDialog shows itself once progress
+        # has been running for the minimum duration, so short imports never
+        # pop up a dialog that immediately vanishes.
+        self.setMinimumDuration(IMPORT_PROGRESS_SHOW_DELAY_MS)
         self.setMinimum(0)
         self.setMaximum(total_records)
         self.setValue(0)
         
         # Labels
-        self.setLabelText(f"Preparing to import {total_records:,} records...")
+        self.setLabelText(f"Preparing to import {self._total_str} records...")
         self.setCancelButtonText("Cancel Import")
         
         # Don't auto-reset or auto-close
         self.setAutoReset(False)
         self.setAutoClose(False)
-        
-        # Show immediately
-        self.show()
+
+        # Throttle repaints; callers may report progress far faster than the screen refreshes.
+        # Left unstarted so the first update is always shown.
+        self._last_repaint = QElapsedTimer()
+        # Label is only rebuilt when the whole percentage or the chunk info changes
+        self._last_pct = -1
+        self._last_chunk_info = None
     
+    @pyqtSlot(int, str)
     def update_progress(self, processed: int, chunk_info: str = ""):
-        """Update progress with current status."""
+        """Update progress with current status.
+
+        Updates are throttled to PROGRESS_UPDATE_INTERVAL_MS. Once the dialog
+        has shown itself, setValue() services the event loop, so each update
+        that gets through paints the dialog and delivers a Cancel click. The
+        dialog is modal, so no other window receives input in the meantime.
+        """
+        if processed == self.processed_records and chunk_info == self._last_chunk_info:
+            return
         self.processed_records = processed
+        if (self._last_repaint.isValid() and processed < self.total_records
+                and self._last_repaint.elapsed() < PROGRESS_UPDATE_INTERVAL_MS):
+            return
+        self._last_repaint.start()
+
         self.setValue(processed)
         
         # Calculate percentage
-        percentage = int((processed / self.total_records) * 100) if self.total_records > 0 else 0
+        percentage = int(processed * 100 / self.total_records) if self.total_records > 0 else 0
+        if percentage == self._last_pct and chunk_info == self._last_chunk_info:
+            return
+        self._last_pct = percentage
+        self._last_chunk_info = chunk_info
         
         # Update label with detailed information
         if chunk_info:
-            label_text = f"Importing records... ({percentage}%)\n{chunk_info}\nProcessed: {processed:,} of {self.total_records:,}"
+            label_text = self.LABEL_TEMPLATE_WITH_INFO % (
+                percentage, chunk_info, f"{processed:,}", self._total_str
+            )
         else:
-            label_text = f"Importing records... ({percentage}%)\nProcessed: {processed:,} of {self.total_records:,}"
+            label_text = self.LABEL_TEMPLATE % (percentage, f"{processed:,}", self._total_str)
         
         self.setLabelText(label_text)
-        
-        # Process events to keep UI responsive
-        from qgis.PyQt.QtWidgets import QApplication
-        QApplication.processEvents()
     
     def finish_import(self, success: bool, final_count: int, message: str = ""):
         """Finish the import process."""
         if success:
             self.setLabelText(f"✅ Import completed successfully!\nImported {final_count:,} records to QGIS.\n{message}")
         else:
-            self.setLabelText(f"❌ Import failed or was cancelled.\nProcessed {self.processed_records:,} of {self.total_records:,} records.\n{message}")
+            self.setLabelText(f"❌ Import failed or was cancelled.\nProcessed {self.processed_records:,} of {self._total_str} records.\n{message}")
         
         self.setCancelButtonText("Close")
         self.setValue(self.maximum())  # Set to 100%
 
 
+_SUMMARY_INFO_QSS = "padding: 10px; background-color: #f0f0f0; border-radius: 5px; color: #333333;"
+_AVAILABILITY_MSG_QSS = (
+    "padding: 10px; background-color: #fff3cd; border: 1px solid #ffc107; "
+    "border-radius: 5px; color: #856404; margin-top: 10px;"
+)
+_NO_DATA_QSS = "color: #666; font-style: italic; padding: 20px;"
+
+
+class _StateContribModel(QAbstractTableModel):
+    """Read-only table of per-state record counts for FetchDetailsDialog.
+
+    Cell text is formatted once up front into plain tuples, so the repeated
+    data() calls made while painting are simple lookups.
+    """
+
+    HEADERS = ("State", "Records", "Percentage")
+
+    def __init__(self, sorted_states, total_fetched, parent=None):
+        super().__init__(parent)
+        scale = 100.0 / total_fetched if total_fetched > 0 else 0.0
+        self._rows = [
+            (state if state else "Unknown", f"{count:,}", f"{count * scale:.1f}%")
+            for state, count in sorted_states
+        ]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][column]
+        if role == Qt.TextAlignmentRole and column > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class FetchDetailsDialog(QDialog):
     """Dialog to show detailed information about fetched records."""
 
@@ -2187,14 +2995,18 @@ class FetchDetailsDialog(QDialog):
         self.setWindowTitle("Fetch Details")
         self.setMinimumSize(500, 400)
 
+        fetch_info = self.fetch_info
+        total_fetched = fetch_info.get('total_fetched', 0)
+        requested_count = fetch_info.get('requested_count', 0)
+        fetch_time = fetch_info.get('fetch_time', 0)
+        data_type = fetch_info.get('data_type', 'Records')
+        state_contributions = fetch_info.get('state_contributions', {})
+
         layout = QVBoxLayout(self)
 
         # Summary section
         summary_label = QLabel("Fetch Summary")
-        summary_font = QFont()
-        summary_font.setBold(True)
-        summary_font.setPointSize(12)
-        summary_label.setFont(summary_font)
+        summary_label.setFont(get_bold_font(12))
         layout.addWidget(summary_label)
 
         # Add separator
@@ -2204,11 +3016,6 @@ class FetchDetailsDialog(QDialog):
         layout.addWidget(separator1)
 
         # Summary info
-        total_fetched = self.fetch_info.get('total_fetched', 0)
-        requested_count = self.fetch_info.get('requested_count', 0)
-        fetch_time = self.fetch_info.get('fetch_time', 0)
-        data_type = self.fetch_info.get('data_type', 'Records')
-
         summary_text = f"<b>Data Type:</b> {data_type}<br>"
         summary_text += f"<b>Records Fetched:</b> {total_fetched:,}<br>"
         summary_text += f"<b>Records Requested:</b> {requested_count:,}<br>"
@@ -2217,7 +3024,7 @@ class FetchDetailsDialog(QDialog):
         summary_info = QLabel(summary_text)
         summary_info.setTextFormat(Qt.RichText)
         summary_info.setWordWrap(True)
-        summary_info.setStyleSheet("padding: 10px; background-color: #f0f0f0; border-radius: 5px; color: #333333;")
+        summary_info.setStyleSheet(_SUMMARY_INFO_QSS)
         layout.addWidget(summary_info)
 
         # Show message if fetched < requested
@@ -2227,20 +3034,14 @@ class FetchDetailsDialog(QDialog):
                 f"This is the complete dataset matching your criteria."
             )
             availability_msg.setWordWrap(True)
-            availability_msg.setStyleSheet(
-                "padding: 10px; background-color: #fff3cd; border: 1px solid #ffc107; "
-                "border-radius: 5px; color: #856404; margin-top: 10px;"
-            )
+            availability_msg.setStyleSheet(_AVAILABILITY_MSG_QSS)
             layout.addWidget(availability_msg)
 
         layout.addSpacing(20)
 
         # State contributions section
         state_label = QLabel("State-wise Distribution")
-        state_font = QFont()
-        state_font.setBold(True)
-        state_font.setPointSize(12)
-        state_label.setFont(state_font)
+        state_label.setFont(get_bold_font(12))
         layout.addWidget(state_label)
 
         # Add separator
@@ -2250,46 +3051,25 @@ class FetchDetailsDialog(QDialog):
         layout.addWidget(separator2)
 
         # State contributions table
-        state_contributions = self.fetch_info.get('state_contributions', {})
-
         if state_contributions:
-            table = QTableWidget()
-            table.setColumnCount(3)
-            table.setHorizontalHeaderLabels(["State", "Records", "Percentage"])
-            table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            table.setEditTriggers(QTableWidget.NoEditTriggers)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
-
             # Sort states by record count (descending)
             sorted_states = sorted(
                 state_contributions.items(),
-                key=lambda x: x[1],
+                key=itemgetter(1),
                 reverse=True
             )
 
-            table.setRowCount(len(sorted_states))
-
-            for row, (state, count) in enumerate(sorted_states):
-                # State name
-                state_item = QTableWidgetItem(state if state else "Unknown")
-                table.setItem(row, 0, state_item)
-
-                # Record count
-                count_item = QTableWidgetItem(f"{count:,}")
-                count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                table.setItem(row, 1, count_item)
-
-                # Percentage
-                percentage = (count / total_fetched * 100) if total_fetched > 0 else 0
-                percentage_item = QTableWidgetItem(f"{percentage:.1f}%")
-                percentage_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                table.setItem(row, 2, percentage_item)
+            table = QTableView()
+            table.setModel(_StateContribModel(sorted_states, total_fetched, table))
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            table.setEditTriggers(QTableView.NoEditTriggers)
+            table.setSelectionBehavior(QTableView.SelectRows)
 
             layout.addWidget(table)
         else:
             no_data_label = QLabel("No state-wise distribution data available.")
             no_data_label.setAlignment(Qt.AlignCenter)
-            no_data_label.setStyleSheet("color: #666; font-style: italic; padding: 20px;")
+            no_data_label.setStyleSheet(_NO_DATA_QSS)
             layout.addWidget(no_data_label)
 
         # Close button
@@ -2303,6 +3083,19 @@ class FetchDetailsDialog(QDialog):
         layout.addWidget(button_box)
 
 
+# Map dialog colours and styles, shared by every instance
+_DRAW_RUBBER_BAND_COLOR = QColor(255, 0, 0, 100)  # Semi-transparent red
+_BBOX_RUBBER_BAND_COLOR = QColor(0, 120, 255, 80)
+_MAP_CANVAS_COLOR = QColor(255, 255, 255)
+# Australia (lon 113..154, lat -44..-10) in Web Mercator (EPSG:3857), the map CRS
+_AUSTRALIA_EXTENT_3857 = QgsRectangle(12579102.46, -5465442.18, 17143201.58, -1118889.97)
+_MAP_INSTRUCTIONS_QSS = "padding: 10px; background-color: #e3f2fd; border-radius: 5px; color: #1976d2;"
+_MAP_COORDS_QSS = (
+    "padding: 10px; background-color: #f5f5f5; border: 1px solid #ddd; "
+    "border-radius: 5px; font-family: monospace; color: #333;"
+)
+
+
 class BoundingBoxRectangleTool(QgsMapTool):
     """Custom map tool for drawing bounding box rectangles by click and drag."""
 
@@ -2318,10 +3111,17 @@ class BoundingBoxRectangleTool(QgsMapTool):
 
         # Create rubber band for visual feedback
         self.rubberBand = QgsRubberBand(self.canvas, QgsWkbTypes.PolygonGeometry)
-        self.rubberBand.setColor(QColor(255, 0, 0, 100))  # Semi-transparent red
+        self.rubberBand.setColor(_DRAW_RUBBER_BAND_COLOR)
         self.rubberBand.setWidth(2)
         self.rubberBand.setLineStyle(Qt.DashLine)
 
+        # Mouse moves only schedule a rubber band rebuild; repeated start()
+        # calls collapse into one rebuild per event loop pass
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._updateRubberBand)
+
     def canvasPressEvent(self, event):
         """Handle mouse press - start drawing rectangle."""
         if event.button() == Qt.LeftButton:
@@ -2336,41 +3136,36 @@ class BoundingBoxRectangleTool(QgsMapTool):
             return
 
         self.endPoint = self.toMapCoordinates(event.pos())
-        self._updateRubberBand()
+        self._update_timer.start()
 
     def canvasReleaseEvent(self, event):
         """Handle mouse release - finalize rectangle."""
         if event.button() == Qt.LeftButton and self.isDrawing:
             self.endPoint = self.toMapCoordinates(event.pos())
             self.isDrawing = False
+            if self._update_timer.isActive():
+                self._update_timer.stop()
+                self._updateRubberBand()
 
             # Create rectangle and emit signal
             rect = QgsRectangle(self.startPoint, self.endPoint)
             if not rect.isEmpty():
                 self.rectangle_created.emit(rect)
 
+    @pyqtSlot()
     def _updateRubberBand(self):
         """Update rubber band to show current rectangle."""
         if self.startPoint is None or self.endPoint is None:
             return
 
-        # Create rectangle points
+        # Replace the geometry in one call so the rubber band updates once
         rect = QgsRectangle(self.startPoint, self.endPoint)
-        points = [
-            QgsPointXY(rect.xMinimum(), rect.yMinimum()),
-            QgsPointXY(rect.xMaximum(), rect.yMinimum()),
-            QgsPointXY(rect.xMaximum(), rect.yMaximum()),
-            QgsPointXY(rect.xMinimum(), rect.yMaximum()),
-            QgsPointXY(rect.xMinimum(), rect.yMinimum())  # Close the rectangle
-        ]
-
-        self.rubberBand.reset(QgsWkbTypes.PolygonGeometry)
-        for point in points:
-            self.rubberBand.addPoint(point, True)
+        self.rubberBand.setToGeometry(QgsGeometry.fromRect(rect), None)
         self.rubberBand.show()
 
     def reset(self):
         """Reset the tool."""
+        self._update_timer.stop()
         self.startPoint = None
         self.endPoint = None
         self.isDrawing = False
@@ -2380,10 +3175,41 @@ class BoundingBoxRectangleTool(QgsMapTool):
     def deactivate(self):
         """Clean up when tool is deactivated."""
         super().deactivate()
+        self._update_timer.stop()
         if self.rubberBand:
             self.rubberBand.reset(QgsWkbTypes.PolygonGeometry)
 
 
+# Project layer id of the OSM basemap shared by map dialogs
+_basemap_layer_id = None
+
+
+def get_basemap_layer():
+    """Get the OSM basemap layer used by map dialogs, creating it on first use.
+
+    The layer is kept in the project (hidden from the legend) and reused, so
+    reopening a dialog keeps the provider and the tiles it has already
+    fetched instead of adding another basemap layer and downloading them again.
+
+    Returns:
+        QgsRasterLayer, or None if the basemap could not be loaded
+    """
+    global _basemap_layer_id
+    project = QgsProject.instance()
+    if _basemap_layer_id is not None:
+        layer = project.mapLayer(_basemap_layer_id)
+        if layer is not None:
+            return layer
+
+    layer = QgsRasterLayer(OSM_LAYER_URL, OSM_LAYER_NAME, "wms")
+    if not layer.isValid():
+        return None
+    project.addMapLayer(layer, addToLegend=False)
+    _basemap_layer_id = layer.id()
+    log_info("OpenStreetMap basemap loaded successfully")
+    return layer
+
+
 class PolygonSelectionDialog(QDialog):
     """Interactive map dialog for selecting a polygon over Australia."""
 
@@ -2416,10 +3242,7 @@ class PolygonSelectionDialog(QDialog):
 
         # Header with instructions
         header_label = QLabel("🗺️ Draw a Bounding Box on the Map")
-        header_font = QFont()
-        header_font.setBold(True)
-        header_font.setPointSize(14)
-        header_label.setFont(header_font)
+        header_label.setFont(get_bold_font(14))
         header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(header_label)
 
@@ -2429,7 +3252,7 @@ class PolygonSelectionDialog(QDialog):
             "• Use Pan and Zoom tools to navigate the map\n"
             "• Your selection will filter data within the box boundaries"
         )
-        instructions.setStyleSheet("padding: 10px; background-color: #e3f2fd; border-radius: 5px; color: #1976d2;")
+        instructions.setStyleSheet(_MAP_INSTRUCTIONS_QSS)
         instructions.setWordWrap(True)
         layout.addWidget(instructions)
 
@@ -2467,6 +3290,12 @@ class PolygonSelectionDialog(QDialog):
         self.clear_box_button.setToolTip("Clear the current bounding box")
         self.clear_box_button.clicked.connect(self._clear_bbox)
 
+        # Only one map tool button can be checked at a time
+        self._tool_group = QButtonGroup(self)
+        self._tool_group.setExclusive(True)
+        for button in (self.pan_button, self.zoom_in_button, self.zoom_out_button, self.draw_button):
+            self._tool_group.addButton(button)
+
         toolbar_layout.addWidget(self.pan_button)
         toolbar_layout.addWidget(self.zoom_in_button)
         toolbar_layout.addWidget(self.zoom_out_button)
@@ -2484,10 +3313,7 @@ class PolygonSelectionDialog(QDialog):
 
         # Coordinates display
         self.coords_label = QLabel("No bounding box selected - Click and drag to draw")
-        self.coords_label.setStyleSheet(
-            "padding: 10px; background-color: #f5f5f5; border: 1px solid #ddd; "
-            "border-radius: 5px; font-family: monospace; color: #333;"
-        )
+        self.coords_label.setStyleSheet(_MAP_COORDS_QSS)
         self.coords_label.setWordWrap(True)
         layout.addWidget(self.coords_label)
 
@@ -2505,48 +3331,41 @@ class PolygonSelectionDialog(QDialog):
 
     def _setup_map(self):
         """Setup the map canvas with Australia-centered view and basemap."""
-        from qgis.core import (
-            QgsCoordinateReferenceSystem,
-            QgsCoordinateTransform,
-            QgsProject,
-            QgsRasterLayer,
-            QgsRectangle
-        )
+        # Hold rendering until CRS, layers, extent and tools are all set
+        self.map_canvas.freeze(True)
 
         # Use Web Mercator (EPSG:3857)
         crs = QgsCoordinateReferenceSystem("EPSG:3857")
         self.map_canvas.setDestinationCrs(crs)
-        self.map_canvas.setCanvasColor(QColor(255, 255, 255))
+
+        # Transforms between the map CRS and WGS84, built once for the dialog
+        wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
+        self._to_wgs84 = QgsCoordinateTransform(crs, wgs84, QgsProject.instance())
+        self._from_wgs84 = QgsCoordinateTransform(wgs84, crs, QgsProject.instance())
+        self.map_canvas.setCanvasColor(_MAP_CANVAS_COLOR)
         self.map_canvas.enableAntiAliasing(True)
 
+        # Render in parallel with cached layer images and preview jobs, so
+        # pans and zooms reuse what is already drawn while tiles arrive
+        self.map_canvas.setMapSettingsFlags(
+            self.map_canvas.mapSettings().flags() | QgsMapSettings.UseRenderingOptimization
+        )
+        self.map_canvas.setCachingEnabled(True)
+        self.map_canvas.setParallelRenderingEnabled(True)
+        self.map_canvas.setPreviewJobsEnabled(True)
+
         # ✅ FIX 1: Use provider "xyz" (not "wms")
         # basemap_url = "type=xyz&url=https://tile.openstreetmap.org/{z}/{x}/{y}.png"
-        basemap_layer = QgsRasterLayer(OSM_LAYER_URL, OSM_LAYER_NAME, "wms")
+        # ✅ FIX 2: The shared basemap is already in the project before setting canvas layers
+        basemap_layer = get_basemap_layer()
 
-        if basemap_layer.isValid():
-            # ✅ FIX 2: Add to project before setting canvas layers
-            QgsProject.instance().addMapLayer(basemap_layer, addToLegend=False)
+        if basemap_layer is not None:
             self.map_canvas.setLayers([basemap_layer])
-            log_info("OpenStreetMap basemap loaded successfully")
         else:
             log_warning("Failed to load OpenStreetMap basemap - using blank canvas")
 
         # ✅ FIX 3: Reset extent to valid area (Australia)
-        transform = QgsCoordinateTransform(
-            QgsCoordinateReferenceSystem("EPSG:4326"),
-            crs,
-            QgsProject.instance()
-        )
-
-        australia_extent_4326 = QgsRectangle(113, -44, 154, -10)
-        australia_extent = transform.transformBoundingBox(australia_extent_4326)
-        self.map_canvas.setExtent(australia_extent)
-
-        # ✅ FIX 4: Unfreeze and refresh *after* extent and layers set
-        self.map_canvas.freeze(False)
-        self.map_canvas.setRenderFlag(True)
-        self.map_canvas.refresh()
-        self.map_canvas.refreshAllLayers()
+        self.map_canvas.setExtent(_AUSTRALIA_EXTENT_3857)
 
         # ✅ Tools and rubber bands
         self.pan_tool = QgsMapToolPan(self.map_canvas)
@@ -2556,12 +3375,16 @@ class PolygonSelectionDialog(QDialog):
         self.draw_tool.rectangle_created.connect(self._on_rectangle_created)
 
         self.bbox_rubber_band = QgsRubberBand(self.map_canvas, QgsWkbTypes.PolygonGeometry)
-        self.bbox_rubber_band.setColor(QColor(0, 120, 255, 80))
+        self.bbox_rubber_band.setColor(_BBOX_RUBBER_BAND_COLOR)
         self.bbox_rubber_band.setWidth(3)
 
-        # ✅ Activate draw tool and refresh again after short delay
         self._activate_draw_tool()
-        QTimer.singleShot(200, self.map_canvas.refreshAllLayers)
+
+        # ✅ FIX 4: Unfreeze and render once *after* extent, layers and tools are set;
+        # _delayed_refresh picks up tiles that arrive later
+        self.map_canvas.freeze(False)
+        self.map_canvas.setRenderFlag(True)
+        self.map_canvas.refresh()
 
 
     def _show_existing_bbox(self, bbox):
@@ -2570,65 +3393,53 @@ class PolygonSelectionDialog(QDialog):
         if coords and len(coords) == 4:
             # Coords are 4 corners: [bottom-left, bottom-right, top-right, top-left]
             # Extract min/max lat/lon
-            lats = [lat for lat, lon in coords]
-            lons = [lon for lat, lon in coords]
+            lats, lons = zip(*coords)
             rect_4326 = QgsRectangle(min(lons), min(lats), max(lons), max(lats))
 
             # Convert to map CRS (Web Mercator)
-            from qgis.core import QgsCoordinateTransform, QgsProject
-            transform = QgsCoordinateTransform(
-                QgsCoordinateReferenceSystem("EPSG:4326"),
-                self.map_canvas.mapSettings().destinationCrs(),
-                QgsProject.instance()
-            )
-            rect = transform.transformBoundingBox(rect_4326)
+            rect = self._from_wgs84.transformBoundingBox(rect_4326)
             self._update_bbox_display(rect)
 
+    @pyqtSlot()
     def _activate_pan_tool(self):
         """Activate pan tool."""
-        self._uncheck_all_tool_buttons()
         self.pan_button.setChecked(True)
-        self.map_canvas.setMapTool(self.pan_tool)
+        self._set_map_tool(self.pan_tool)
 
+    @pyqtSlot()
     def _activate_zoom_in_tool(self):
         """Activate zoom in tool."""
-        self._uncheck_all_tool_buttons()
         self.zoom_in_button.setChecked(True)
-        self.map_canvas.setMapTool(self.zoom_in_tool)
+        self._set_map_tool(self.zoom_in_tool)
 
+    @pyqtSlot()
     def _activate_zoom_out_tool(self):
         """Activate zoom out tool."""
-        self._uncheck_all_tool_buttons()
         self.zoom_out_button.setChecked(True)
-        self.map_canvas.setMapTool(self.zoom_out_tool)
+        self._set_map_tool(self.zoom_out_tool)
 
+    @pyqtSlot()
     def _activate_draw_tool(self):
         """Activate draw tool."""
-        self._uncheck_all_tool_buttons()
         self.draw_button.setChecked(True)
-        self.map_canvas.setMapTool(self.draw_tool)
+        self._set_map_tool(self.draw_tool)
 
-    def _uncheck_all_tool_buttons(self):
-        """Uncheck all tool buttons."""
-        self.pan_button.setChecked(False)
-        self.zoom_in_button.setChecked(False)
-        self.zoom_out_button.setChecked(False)
-        self.draw_button.setChecked(False)
+    def _set_map_tool(self, tool):
+        """Make tool the canvas map tool unless it already is.
 
+        Re-setting the active tool would deactivate and reactivate it, which
+        clears the draw tool's rubber band mid-drawing.
+        """
+        if self.map_canvas.mapTool() is not tool:
+            self.map_canvas.setMapTool(tool)
+
+    @pyqtSlot()
     def _reset_map_view(self):
         """Reset map view to Australia."""
-        # Convert WGS84 bounds to Web Mercator
-        from qgis.core import QgsCoordinateTransform, QgsProject
-        transform = QgsCoordinateTransform(
-            QgsCoordinateReferenceSystem("EPSG:4326"),
-            self.map_canvas.mapSettings().destinationCrs(),
-            QgsProject.instance()
-        )
-        australia_extent_4326 = QgsRectangle(113, -44, 154, -10)
-        australia_extent = transform.transformBoundingBox(australia_extent_4326)
-        self.map_canvas.setExtent(australia_extent)
+        self.map_canvas.setExtent(_AUSTRALIA_EXTENT_3857)
         self.map_canvas.refresh()
 
+    @pyqtSlot()
     def _clear_bbox(self):
         """Clear the current bounding box."""
         self.selected_polygon = None
@@ -2636,6 +3447,7 @@ class PolygonSelectionDialog(QDialog):
         self.coords_label.setText("No bounding box selected - Click and drag to draw")
         self.draw_tool.reset()
 
+    @pyqtSlot(QgsRectangle)
     def _on_rectangle_created(self, rect):
         """Handle rectangle creation from draw tool."""
         self._update_bbox_display(rect)
@@ -2643,13 +3455,7 @@ class PolygonSelectionDialog(QDialog):
     def _update_bbox_display(self, rect):
         """Update the bounding box display on map and in UI."""
         # Convert rectangle from map CRS to WGS84 for storage
-        from qgis.core import QgsCoordinateTransform, QgsProject
-        transform = QgsCoordinateTransform(
-            self.map_canvas.mapSettings().destinationCrs(),
-            QgsCoordinateReferenceSystem("EPSG:4326"),
-            QgsProject.instance()
-        )
-        rect_4326 = transform.transformBoundingBox(rect)
+        rect_4326 = self._to_wgs84.transformBoundingBox(rect)
 
         # Store as 4 corner coordinates (bottom-left, bottom-right, top-right, top-left) in lat,lon format
         coords = [
@@ -2664,17 +3470,7 @@ class PolygonSelectionDialog(QDialog):
         }
 
         # Update rubber band display (in map CRS)
-        points = [
-            QgsPointXY(rect.xMinimum(), rect.yMinimum()),
-            QgsPointXY(rect.xMaximum(), rect.yMinimum()),
-            QgsPointXY(rect.xMaximum(), rect.yMaximum()),
-            QgsPointXY(rect.xMinimum(), rect.yMaximum()),
-            QgsPointXY(rect.xMinimum(), rect.yMinimum())
-        ]
-
-        self.bbox_rubber_band.reset(QgsWkbTypes.PolygonGeometry)
-        for point in points:
-            self.bbox_rubber_band.addPoint(point, True)
+        self.bbox_rubber_band.setToGeometry(QgsGeometry.fromRect(rect), None)
         self.bbox_rubber_band.show()
 
         # Update coordinates label
@@ -2684,6 +3480,7 @@ class PolygonSelectionDialog(QDialog):
             f"Longitude: {rect_4326.xMinimum():.4f}° to {rect_4326.xMaximum():.4f}°"
         )
 
+    @pyqtSlot()
     def _on_accept(self):
         """Handle OK button click."""
         if self.selected_polygon is None:
@@ -2702,16 +3499,42 @@ class PolygonSelectionDialog(QDialog):
 
     def _delayed_refresh(self):
         """Delayed refresh to ensure basemap tiles load properly."""
-        self.map_canvas.refresh()
+        # refreshAllLayers() refreshes the canvas itself
         self.map_canvas.refreshAllLayers()
 
 
+# Range colour button style; %s is the colour name
+_RANGE_COLOR_BUTTON_QSS_TMPL = """
+    QPushButton {
+        background-color: %s;
+        border: 1px solid #333;
+        padding: 4px;
+        font-weight: bold;
+    }
+"""
+
+
 class TraceRangeWidget(QWidget):
     """Widget for configuring a single trace range with name, color, and boundaries."""
 
     removed = pyqtSignal(object)  # Emits self when remove button clicked
     changed = pyqtSignal()  # Emits when any value changes
 
+    # RangeType items shared by every lower/upper type combo, built on first use
+    _range_type_model = None
+
+    @classmethod
+    def _get_range_type_model(cls):
+        """Get the shared model listing every RangeType (data in Qt.UserRole)."""
+        if cls._range_type_model is None:
+            model = QStandardItemModel()
+            for range_type in RangeType:
+                item = QStandardItem(range_type.value)
+                item.setData(range_type, Qt.UserRole)
+                model.appendRow(item)
+            cls._range_type_model = model
+        return cls._range_type_model
+
     def __init__(self, trace_range=None, parent=None):
         """
         Initialize trace range widget.
@@ -2721,7 +3544,6 @@ class TraceRangeWidget(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
-        from ..config.trace_ranges import TraceRange, BoundaryFormula, RangeType
 
         self.trace_range = trace_range
         self._setup_ui()
@@ -2732,8 +3554,6 @@ class TraceRangeWidget(QWidget):
 
     def _setup_ui(self):
         """Setup the widget UI."""
-        from ..config.trace_ranges import RangeType
-
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(8)
@@ -2752,7 +3572,9 @@ class TraceRangeWidget(QWidget):
         self.color_button.setDefault(False)
         self.color_button.setAutoDefault(False)
         self.color_button.setCursor(QCursor(Qt.PointingHandCursor))  # Show pointer cursor on hover
-        self.selected_color = QColor(100, 181, 246)  # Default blue
+        # Start from the range colour when there is one so the button is styled only once
+        self.selected_color = self.trace_range.color if self.trace_range else QColor(100, 181, 246)  # Default blue
+        self._color_button_color_name = None  # Colour the button stylesheet was last built for
         self._update_color_button()
         self.color_button.clicked.connect(self._select_color)
         top_row.addWidget(self.color_button)
@@ -2787,8 +3609,7 @@ class TraceRangeWidget(QWidget):
         lower_row.addWidget(lower_label)
 
         self.lower_type_combo = NoScrollComboBox()
-        for range_type in RangeType:
-            self.lower_type_combo.addItem(range_type.value, range_type)
+        self.lower_type_combo.setModel(self._get_range_type_model())
         self.lower_type_combo.currentIndexChanged.connect(self.changed.emit)
         self.lower_type_combo.setFocusPolicy(Qt.ClickFocus)  # Prevent wheel scrolling when not focused
         lower_row.addWidget(self.lower_type_combo, stretch=2)
@@ -2810,8 +3631,7 @@ class TraceRangeWidget(QWidget):
         upper_row.addWidget(upper_label)
 
         self.upper_type_combo = NoScrollComboBox()
-        for range_type in RangeType:
-            self.upper_type_combo.addItem(range_type.value, range_type)
+        self.upper_type_combo.setModel(self._get_range_type_model())
         self.upper_type_combo.currentIndexChanged.connect(self.changed.emit)
         self.upper_type_combo.setFocusPolicy(Qt.ClickFocus)  # Prevent wheel scrolling when not focused
         upper_row.addWidget(self.upper_type_combo, stretch=2)
@@ -2832,6 +3652,7 @@ class TraceRangeWidget(QWidget):
         separator.setFrameShadow(QFrame.Sunken)
         layout.addWidget(separator)
 
+    @pyqtSlot()
     def _select_color(self):
         """Open color picker dialog."""
         color = QColorDialog.getColor(self.selected_color, self, "Choose Range Color")
@@ -2841,38 +3662,44 @@ class TraceRangeWidget(QWidget):
             self.changed.emit()
 
     def _update_color_button(self):
-        """Update color button appearance."""
-        self.color_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.selected_color.name()};
-                border: 1px solid #333;
-                padding: 4px;
-                font-weight: bold;
-            }}
-        """)
+        """Update color button appearance if the colour changed."""
+        color_name = self.selected_color.name()
+        if color_name != self._color_button_color_name:
+            self._color_button_color_name = color_name
+            self.color_button.setStyleSheet(_RANGE_COLOR_BUTTON_QSS_TMPL % color_name)
+
+    def set_trace_range(self, trace_range):
+        """Show a different TraceRange in this widget without emitting changed."""
+        self.trace_range = trace_range
+        self._populate_from_trace_range(trace_range)
 
     def _populate_from_trace_range(self, trace_range):
-        """Populate widget from TraceRange object."""
-        self.name_input.setText(trace_range.name)
-        self.selected_color = trace_range.color
-        self._update_color_button()
+        """Populate widget from TraceRange object.
 
-        # Set lower boundary
-        lower_idx = self.lower_type_combo.findData(trace_range.lower_boundary.formula_type)
-        if lower_idx >= 0:
-            self.lower_type_combo.setCurrentIndex(lower_idx)
-        self.lower_value_spin.setValue(trace_range.lower_boundary.value)
+        The input widgets' signals are blocked while their values are set, so
+        populating does not emit changed once per field.
+        """
+        with QSignalBlocker(self.name_input), \
+                QSignalBlocker(self.lower_type_combo), QSignalBlocker(self.lower_value_spin), \
+                QSignalBlocker(self.upper_type_combo), QSignalBlocker(self.upper_value_spin):
+            self.name_input.setText(trace_range.name)
+            self.selected_color = trace_range.color
+            self._update_color_button()
+
+            # Set lower boundary
+            lower_idx = self.lower_type_combo.findData(trace_range.lower_boundary.formula_type)
+            if lower_idx >= 0:
+                self.lower_type_combo.setCurrentIndex(lower_idx)
+            self.lower_value_spin.setValue(trace_range.lower_boundary.value)
 
-        # Set upper boundary
-        upper_idx = self.upper_type_combo.findData(trace_range.upper_boundary.formula_type)
-        if upper_idx >= 0:
-            self.upper_type_combo.setCurrentIndex(upper_idx)
-        self.upper_value_spin.setValue(trace_range.upper_boundary.value)
+            # Set upper boundary
+            upper_idx = self.upper_type_combo.findData(trace_range.upper_boundary.formula_type)
+            if upper_idx >= 0:
+                self.upper_type_combo.setCurrentIndex(upper_idx)
+            self.upper_value_spin.setValue(trace_range.upper_boundary.value)
 
     def get_trace_range(self):
         """Get TraceRange object from widget values."""
-        from ..config.trace_ranges import TraceRange, BoundaryFormula
-
         name = self.name_input.text().strip() or "Unnamed Range"
 
         lower_type = self.lower_type_combo.currentData()
@@ -0,0 +1,72 @@
+# coding=utf-8
+"""Tests for the incremental placement of FlowLayout."""
+
+import unittest
+
+try:
+    from qgis.PyQt.QtCore import QRect
+    from qgis.PyQt.QtWidgets import QApplication, QWidget
+except ImportError:  # Run inside a QGIS environment, see `make test`
+    QApplication = None
+
+if QApplication is not None:
+    from src.ui.components import FlowLayout
+
+
+@unittest.skipIf(QApplication is None, "qgis is not available")
+class FlowLayoutTest(unittest.TestCase):
+    """Items resized after a layout pass are placed from the right line state."""
+
+    RECT = QRect(0, 0, 200, 100) if QApplication is not None else None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.container = QWidget()
+        self.layout = FlowLayout(self.container, spacing=5)
+        self.items = []
+        for _ in range(3):
+            widget = QWidget()
+            widget.setFixedSize(30, 20)
+            self.layout.addWidget(widget)
+            self.items.append(widget)
+        self.layout.setGeometry(self.RECT)
+
+    def tearDown(self):
+        self.container.deleteLater()
+
+    def test_initial_placement(self):
+        """Items are placed left to right with the layout spacing."""
+        self.assertEqual([w.geometry() for w in self.items], [
+            QRect(0, 0, 30, 20), QRect(35, 0, 30, 20), QRect(70, 0, 30, 20)
+        ])
+
+    def test_relabel_last_item(self):
+        """Growing the last item (e.g. the "view all" chip) keeps its position."""
+        self.items[2].setFixedSize(50, 20)
+        self.layout.invalidate()
+        self.layout.setGeometry(self.RECT)
+        self.assertEqual(self.items[2].geometry(), QRect(70, 0, 50, 20))
+        self.assertEqual(self.layout.heightForWidth(200), 20)
+
+    def test_resize_middle_item(self):
+        """Items after a resized one move by the size difference only."""
+        self.items[1].setFixedSize(60, 20)
+        self.layout.invalidate()
+        self.layout.setGeometry(self.RECT)
+        self.assertEqual(self.items[1].geometry(), QRect(35, 0, 60, 20))
+        self.assertEqual(self.items[2].geometry(), QRect(100, 0, 30, 20))
+
+    def test_resize_wraps_following_items(self):
+        """A resize that overflows the row moves the following items down."""
+        self.items[1].setFixedSize(150, 20)
+        self.layout.invalidate()
+        self.layout.setGeometry(self.RECT)
+        self.assertEqual(self.items[2].geometry(), QRect(0, 25, 30, 20))
+        self.assertEqual(self.layout.heightForWidth(200), 45)
+
+
+if __name__ == "__main__":
+    unittest.main()